@@ -1,14 +1,45 @@
 import os
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import datetime
+import functools
+from decimal import Decimal
 from typing import Dict, List, Any, Optional, Callable, Union, Set, Tuple
 from urllib.parse import urlencode
 import websocket
 import threading
 import time
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # C parser; its JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
+
+# Order leg keys are a small fixed set, so their dasherized forms are looked up instead of rebuilt
+_LEG_KEY_MAP = {
+    "symbol": "symbol",
+    "quantity": "quantity",
+    "action": "action",
+    "instrument_type": "instrument-type"
+}
+
+
+def _dasherize_leg(leg: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a caller-supplied order leg's keys to the API's dasherized keys."""
+    return {_LEG_KEY_MAP.get(k) or k.replace("_", "-"): v for k, v in leg.items()}
+
+
+def _json_default(value: Any) -> str:
+    """Serialize Decimal prices as exact decimal strings in request bodies."""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 class TastytradeAPI:
     """
@@ -114,7 +145,17 @@ class TastytradeAPI:
             A requests.Session object specific to the current thread.
         """
         if not hasattr(self._session, "session"):
-            self._session.session = requests.Session()
+            session = requests.Session()
+            # Pool keep-alive connections so repeated calls skip the TCP/TLS handshake.
+            # Failed connects are retried for every method, POST included, since the request never left.
+            # Read errors are only retried for idempotent methods, and other=0 stops a request that failed
+            # mid-send from being resent, so orders are never resubmitted.
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                                  max_retries=Retry(total=3, other=0, backoff_factor=0.3))
+            session.mount("https://", adapter)
+            # Large JSON payloads (e.g. a week of order history) compress well; requests decompresses transparently.
+            session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+            self._session.session = session
         return self._session.session
 
     def _request(
@@ -152,15 +193,17 @@ class TastytradeAPI:
         if self.authorization_header:
             headers.update(self.authorization_header)
 
+        # Request bodies are built with the API's dasherized keys, so they are sent as-is
+        body = None
         if data:
-            data = self._dasherize_keys(data)
             headers['Content-Type'] = 'application/json'
+            body = json.dumps(data, default=_json_default)
 
         try:
-            response = session.request(method, url, params=params, json=data, headers=headers,
+            response = session.request(method, url, params=params, data=body, headers=headers,
                                        timeout=10)  # Added timeout
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401 and not is_retry:
                 if "Unauthorized" in str(e):
@@ -193,26 +236,9 @@ class TastytradeAPI:
         except requests.exceptions.RequestException as e:
             print(f"Request Exception: {e}")
             return None
-
-    def _dasherize_keys(self, data: Any) -> Any:
-        """
-        Recursively convert camelCase or snake_case keys to dasherized-keys.
-
-        Args:
-            data: The data to transform (dict, list, or primitive type).
-            
-        Returns:
-            Transformed data with dasherized keys.
-        """
-        if isinstance(data, dict):
-            return {
-                k.replace("_", "-"): self._dasherize_keys(v)
-                for k, v in data.items()
-            }
-        elif isinstance(data, list):
-            return [self._dasherize_keys(item) for item in data]
-        else:
-            return data
+        except json.JSONDecodeError as e:
+            print(f"Invalid JSON response: {e}")
+            return None
 
     def login(self) -> bool:
         """
@@ -331,8 +357,9 @@ class TastytradeAPI:
         return response_data["data"]["items"] if response_data and "data" in response_data and "items" in response_data[
             "data"] else None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def _prepare_option_symbol(
-        self, 
         underlying_symbol: str, 
         expiration_date: Union[datetime.date, str], 
         strike_price: float, 
@@ -341,6 +368,8 @@ class TastytradeAPI:
         """
         Construct OCC option symbol.
         
+        The result depends only on the arguments, so it is memoized.
+        
         Args:
             underlying_symbol: The ticker symbol of the underlying asset.
             expiration_date: The option expiration date (datetime.date or string 'YYYY-MM-DD').
@@ -604,7 +633,7 @@ class TastytradeAPI:
             message: The received message string.
         """
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             print("Market Data Received:", data)  # Keep for debugging
 
             # Handle DxLink responses (Authorization and Setup)
@@ -826,6 +855,26 @@ class TastytradeAPI:
         self._dxlink_send(self.ws_market_data, "FEED_SUBSCRIPTION", data=subscription_message,
                           channel=self.setup_channel)
 
+    def unsubscribe_from_option_quotes(self, symbols: List[str]) -> None:
+        """
+        Removes quote and Greeks subscriptions for the given option symbols.
+        
+        Args:
+            symbols: List of option symbols to unsubscribe from.
+        """
+        if not self.ws_market_data:
+            print("Market data WebSocket not connected.")
+            return
+
+        # Remove FEED_SUBSCRIPTION
+        subscription_message = {
+            "remove": [{"type": "Quote", "symbol": symbol} for symbol in symbols] +
+                      [{"type": "Greeks", "symbol": symbol} for symbol in symbols]
+        }
+        print(f"Sending FEED_SUBSCRIPTION: {subscription_message}")
+        self._dxlink_send(self.ws_market_data, "FEED_SUBSCRIPTION", data=subscription_message,
+                          channel=self.setup_channel)
+
     def subscribe_to_equity_quotes(self, symbols: List[str], reset: bool = True) -> None:
         """
         Subscribes to quote events for the given equity symbols.
@@ -886,7 +935,7 @@ class TastytradeAPI:
             message: The received message string.
         """
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             print("Account Data Received:", data)  # For debug
         except json.JSONDecodeError:
             print(f"Invalid JSON received: {message}")
@@ -1174,7 +1223,7 @@ class TastytradeAPI:
             "source": "user",
             "order-type": order_type,
             "time-in-force": time_in_force,
-            "legs": [self._dasherize_keys(leg) for leg in legs]
+            "legs": [_dasherize_leg(leg) for leg in legs]
         }
 
         if order_type == "Limit" and limit_price is not None:
@@ -1215,7 +1264,7 @@ class TastytradeAPI:
         data = {
             "order-type": order_type,
             "time-in-force": time_in_force,
-            "legs": [self._dasherize_keys(leg) for leg in legs]
+            "legs": [_dasherize_leg(leg) for leg in legs]
         }
 
         if order_type == "Limit" and price is not None:
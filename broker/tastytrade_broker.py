@@ -1,5 +1,11 @@
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple, Any
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Any
 
 from ..api.tastytrade_api import TastytradeAPI
 from ..models.account import Account
@@ -7,6 +13,9 @@ from ..models.position import Position
 from ..models.order import Order
 from ..models.symbol import Symbol
 
+# Fetches every field strike selection needs from an option chain strike in one call
+_get_strike_fields = itemgetter("strike-price", "put", "call", "put-streamer-symbol", "call-streamer-symbol")
+
 
 class TastytradeBroker:
     """
@@ -23,6 +32,15 @@ class TastytradeBroker:
         orders_to_fill (List[Order]): List of orders pending execution.
     """
 
+    POSITIONS_CACHE_TTL: float = 5.0  # Seconds a positions response is reused across scans
+    OPTION_INFO_CACHE_TTL: float = 24 * 60 * 60  # Option contract metadata does not change once listed
+    ORDERS_CACHE_TTL: float = 60.0  # Seconds an indexed order history is reused across scans
+    FIRST_QUOTE_TIMEOUT: float = 2.0  # Seconds to wait for the first streamed quote of a new subscription
+    FIRST_GREEKS_TIMEOUT: float = 5.0  # Seconds to wait for Greeks on a newly subscribed strike band
+    DRY_RUN_CACHE_TTL: float = 60.0  # Seconds a successful dry run vouches for an identical order
+    OPTION_CHAIN_CACHE_TTL: float = 5 * 60  # Seconds an expiration's strike listing is reused
+    BUYING_POWER_CACHE_TTL: float = 30.0  # Seconds an account's derivative buying power is reused
+
     def __init__(self) -> None:
         """
         Initialize the Tastytrade broker.
@@ -34,13 +52,41 @@ class TastytradeBroker:
         self.accounts: Dict[str, Account] = {}
         self.symbols_to_monitor: Dict[str, Symbol] = {'SPX': Symbol('SPX')}
         self.orders_to_fill: List[Order] = []
+        self._executor = ThreadPoolExecutor(max_workers=10)  # Shared pool for concurrent API calls
+        self._listener_executor = ThreadPoolExecutor(max_workers=4)  # Runs quote listeners apart from API calls
+        self._positions_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._option_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._symbol_to_streamer: Dict[str, str] = {}
+        self._order_leg_index_cache: Dict[str, Tuple[float, Dict[FrozenSet[str], List[Dict[str, Any]]]]] = {}
+        self._first_quote_events: Dict[str, threading.Event] = {}
+        self._first_greeks_events: Dict[str, threading.Event] = {}
+        self._monitor_lock = threading.Lock()  # Guards check-then-insert on symbols_to_monitor
+        self._dry_run_cache: Dict[Tuple[Any, ...], float] = {}
+        self._option_chain_cache: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]], bool]] = {}  # (ts, strikes, sorted)
+        self._quote_listeners: Dict[str, List[Callable[[str, Dict[str, Any]], None]]] = {}
+        self._buying_power_cache: Dict[str, Tuple[float, float]] = {}
         self._fetch_accounts()
 
     def process_orders(self) -> None:
         """
         Process all pending orders.
         
-        For each order in orders_to_fill:
+        Each order is advanced one step on the broker's worker pool so that
+        the network calls for independent orders overlap. Orders that are
+        finished are removed once every order has been processed.
+        """
+        orders = list(self.orders_to_fill)
+        results = list(self._executor.map(self._process_order, orders))
+
+        # Remove processed orders
+        for order, remove in zip(orders, results):
+            if remove:
+                self.orders_to_fill.remove(order)
+
+    def _process_order(self, order: Order) -> bool:
+        """
+        Advance a single pending order by one step.
+        
         1. If filled, consider removing (based on user preference)
         2. If failed (rejected, cancelled, expired), remove and log
         3. If live and time elapsed, adjust the order
@@ -48,64 +94,64 @@ class TastytradeBroker:
         5. If symbol exists, create the order
         6. If option chain exists, find the appropriate symbol
         7. Otherwise, fetch the option chain
-        """
-        # Create a list to track orders that should be removed
-        orders_to_remove = []
         
-        for order in self.orders_to_fill:
-            if order.order_status == 'Filled':
-                # Order is complete, mark for removal
-                orders_to_remove.append(order)
-                print(f"Order {order.order_id} for {order.symbol} is filled and will be removed from tracking.")
-                
-            elif order.order_status in ("Removed", "Rejected", "Cancelled", "Expired"):
-                # Order failed, mark for removal and log
-                orders_to_remove.append(order)
-                print(f"Order {order.order_id} for {order.symbol} {order.order_status}. Removing from tracking.")
-                
-            elif order.order_id == 'Live':
-                # Check if enough time has elapsed to adjust the order
-                elapsed = datetime.now() - order.datetime if order.datetime else timedelta(seconds=order.seconds_to_wait + 1)
-                if elapsed > timedelta(seconds=order.seconds_to_wait):
-                    self._adjust_order(order)
-                    
-            elif order.order_id:
-                # Check status of existing order
-                order.order_status = self.api_client.get_order_status(order.account, order.order_id)
+        Args:
+            order: The Order to process.
+            
+        Returns:
+            True if the order should be removed from tracking, False otherwise.
+        """
+        if order.order_status == 'Filled':
+            # Order is complete, mark for removal
+            print(f"Order {order.order_id} for {order.symbol} is filled and will be removed from tracking.")
+            return True
+            
+        elif order.order_status in ("Removed", "Rejected", "Cancelled", "Expired"):
+            # Order failed, mark for removal and log
+            print(f"Order {order.order_id} for {order.symbol} {order.order_status}. Removing from tracking.")
+            return True
+            
+        elif order.order_id == 'Live':
+            # Check if enough time has elapsed to adjust the order
+            elapsed = datetime.now() - order.datetime if order.datetime else timedelta(seconds=order.seconds_to_wait + 1)
+            if elapsed > timedelta(seconds=order.seconds_to_wait):
+                self._adjust_order(order)
                 
-            elif order.symbol:
-                # Check trend if applicable before creating order
-                if order.streamer_symbol in self.symbols_to_monitor:
-                    symbol_data = self.symbols_to_monitor[order.streamer_symbol]
-                    # For buy orders, prefer uptrend; for sell orders, prefer downtrend
-                    trend_favorable = (
-                        (symbol_data.is_trending_up and order.action.startswith('Buy')) or
-                        (not symbol_data.is_trending_up and order.action.startswith('Sell'))
-                    )
-                    if trend_favorable or symbol_data.is_trending_up is None:
-                        # Create the order if trend is favorable or can't determine trend
-                        order.order_id = self._create_order(order)
-                        order.datetime = datetime.now()
-                    else:
-                        print(f"Delaying order for {order.symbol} due to unfavorable trend.")
-                else:
-                    # No trend data available, proceed with order creation
+        elif order.order_id:
+            # Check status of existing order
+            order.order_status = self.api_client.get_order_status(order.account, order.order_id)
+            
+        elif order.symbol:
+            # Check trend if applicable before creating order
+            if order.streamer_symbol in self.symbols_to_monitor:
+                symbol_data = self.symbols_to_monitor[order.streamer_symbol]
+                # For buy orders, prefer uptrend; for sell orders, prefer downtrend
+                trend_favorable = (
+                    (symbol_data.is_trending_up and order.action.startswith('Buy')) or
+                    (not symbol_data.is_trending_up and order.action.startswith('Sell'))
+                )
+                if trend_favorable or symbol_data.is_trending_up is None:
+                    # Create the order if trend is favorable or can't determine trend
                     order.order_id = self._create_order(order)
                     order.datetime = datetime.now()
-                    
-            elif order.option_chain:
-                # Find the appropriate symbol from the option chain
-                symbol_data = self._find_symbol_from_option_chain(order)
-                if symbol_data:
-                    order.symbol, order.streamer_symbol, order.strike_price = symbol_data
-                    
+                else:
+                    print(f"Delaying order for {order.symbol} due to unfavorable trend.")
             else:
-                # Fetch the option chain
-                order.option_chain = self._add_option_chain_to_streaming(order)
-        
-        # Remove processed orders
-        for order in orders_to_remove:
-            self.orders_to_fill.remove(order)
+                # No trend data available, proceed with order creation
+                order.order_id = self._create_order(order)
+                order.datetime = datetime.now()
+                
+        elif order.option_chain:
+            # Find the appropriate symbol from the option chain
+            symbol_data = self._find_symbol_from_option_chain(order)
+            if symbol_data:
+                order.symbol, order.streamer_symbol, order.strike_price = symbol_data
+                
+        else:
+            # Fetch the option chain
+            order.option_chain = self._add_option_chain_to_streaming(order)
+
+        return False
 
     def option_order(
         self, 
@@ -170,6 +216,41 @@ class TastytradeBroker:
         print("Strategy Quote Handler called with", symbol, quote_data)
         if symbol in self.symbols_to_monitor:
             self.symbols_to_monitor[symbol].update_prices(quote_data)
+            first_quote_event = self._first_quote_events.get(symbol)
+            if first_quote_event:
+                first_quote_event.set()
+            # Run listeners off the streaming thread and off the API pool, so a slow or
+            # blocking listener stalls neither the feed nor order processing and exit checks
+            for listener in tuple(self._quote_listeners.get(symbol, ())):
+                self._listener_executor.submit(listener, symbol, quote_data)
+
+    def add_quote_listener(self, streamer_symbol: str, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        """
+        Register a callback to run after each quote update for a symbol.
+
+        Listeners are called with the streamer symbol and the quote data on a
+        pool reserved for listeners, so they may block without starving the
+        broker's API calls.
+
+        Args:
+            streamer_symbol: The streamer symbol to listen for.
+            listener: A function that takes the streamer symbol and the quote data dictionary.
+        """
+        self._quote_listeners.setdefault(streamer_symbol, []).append(listener)
+
+    def remove_quote_listener(self, streamer_symbol: str, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        """
+        Unregister a callback previously added with add_quote_listener.
+
+        Args:
+            streamer_symbol: The streamer symbol the listener was registered for.
+            listener: The function to remove.
+        """
+        listeners = self._quote_listeners.get(streamer_symbol)
+        if listeners and listener in listeners:
+            listeners.remove(listener)
+            if not listeners:
+                del self._quote_listeners[streamer_symbol]
 
     def handle_greeks_update(self, symbol: str, greeks_data: Dict[str, Any]) -> None:
         """
@@ -184,6 +265,9 @@ class TastytradeBroker:
         print("Strategy Greeks Handler called with", symbol, greeks_data)
         if symbol in self.symbols_to_monitor:
             self.symbols_to_monitor[symbol].update_greeks(greeks_data)
+            first_greeks_event = self._first_greeks_events.get(symbol)
+            if first_greeks_event:
+                first_greeks_event.set()
 
     def _adjust_order(self, order: Order) -> None:
         """
@@ -193,9 +277,7 @@ class TastytradeBroker:
             order: The Order to adjust.
         """
         order.adjust_limit_distance()
-        symbol = self.symbols_to_monitor[order.streamer_symbol]
-        bid_ask_distance = symbol.prices[-1].ask_price - symbol.prices[-1].bid_price
-        limit_price = symbol.prices[-1].bid_price + (bid_ask_distance * order.limit_distance)
+        limit_price = self.symbols_to_monitor[order.streamer_symbol].current_limit_price(order.limit_distance)
         response = self.api_client.replace_option_order(order.account, order.order_id, limit_price)
         print(response)
 
@@ -212,9 +294,7 @@ class TastytradeBroker:
         Returns:
             The order ID if created successfully, or None if creation failed.
         """
-        symbol = self.symbols_to_monitor[order.streamer_symbol]
-        bid_ask_distance = symbol.prices[-1].ask_price - symbol.prices[-1].bid_price
-        limit_price = symbol.prices[-1].bid_price + (bid_ask_distance * order.limit_distance)
+        limit_price = self.symbols_to_monitor[order.streamer_symbol].current_limit_price(order.limit_distance)
         response = self.api_client.create_option_order(
             order.account, 
             order.underlying_symbol,
@@ -265,14 +345,14 @@ class TastytradeBroker:
             if not symbol_data.prices:
                 continue  # Skip if no price data available
                 
-            if order.price and symbol_data.prices[-1].bid_price < order.price <= symbol_data.prices[-1].ask_price:
+            if order.price and symbol_data.last_bid < order.price <= symbol_data.last_ask:
                 # Found an option with price in the bid/ask range
                 order_symbol = strike['symbol']
                 order_streamer_symbol = streamer_symbol
                 order_strike_price = float(strike['strike-price'])
                 break
                 
-            elif order.delta and symbol_data.greeks and symbol_data.greeks[-1].delta <= order.delta:
+            elif order.delta and symbol_data.greeks and symbol_data.last_delta <= order.delta:
                 # Found an option with delta <= target_delta
                 order_symbol = strike['symbol']
                 order_streamer_symbol = streamer_symbol
@@ -299,64 +379,55 @@ class TastytradeBroker:
         """
         if not order:
             return None
-            
-        option_chain = self.api_client.get_option_chain(order.underlying_symbol)
-        if not option_chain:
-            print(f"Failed to retrieve {order.underlying_symbol} option chain.")
-            return None
-
-        expiration_str = order.expiration_date.strftime("%Y-%m-%d")
-        target_expiration = None
 
-        option_chain_data = option_chain['data']
-        option_chain_items = option_chain_data['items']
-        for item in option_chain_items:
-            for expiration in item['expirations']:
-                if expiration['expiration-date'] == expiration_str:
-                    target_expiration = expiration
-                    break
-                    
-        if target_expiration is None:
-            print(f"No expiration found for {expiration_str}.")
+        strikes = self._get_expiration_strikes(
+            order.underlying_symbol, order.expiration_date.strftime("%Y-%m-%d"))
+        if strikes is None:
             return None
 
         # Get the current price of SPX (or use another reference if needed)
         spx_price = 0
         if 'SPX' in self.symbols_to_monitor and self.symbols_to_monitor['SPX'].prices:
-            spx_price = self.symbols_to_monitor['SPX'].prices[-1].last_price
+            spx_price = self.symbols_to_monitor['SPX'].last_price
         else:
             print("Warning: No SPX price available for strike selection.")
             return None
 
-        strikes = target_expiration["strikes"]
-        
+        # Strikes are returned in ascending order, so the price window can be located by bisection
+        strike_prices = [float(strike['strike-price']) for strike in strikes]
+
+        if order.option_type.upper() == 'P':
+            min_strike_price = spx_price - 200
+            max_strike_price = spx_price + 20
+            symbol_key, streamer_symbol_key = 'put', 'put-streamer-symbol'
+        else:
+            min_strike_price = spx_price - 20
+            max_strike_price = spx_price + 200
+            symbol_key, streamer_symbol_key = 'call', 'call-streamer-symbol'
+
+        lo = bisect_left(strike_prices, min_strike_price)
+        hi = bisect_right(strike_prices, max_strike_price)
+
         # Track streamer symbols we've already added to avoid duplicates
         added_streamer_symbols = set()
         option_chain_to_return = []
+        symbols_to_monitor = self.symbols_to_monitor
         
-        for strike in strikes:
-            if order.option_type.upper() == 'P':
-                min_strike_price = spx_price - 200
-                max_strike_price = spx_price + 20
-                symbol = strike['put']
-                streamer_symbol = strike['put-streamer-symbol']
-            else:
-                min_strike_price = spx_price - 20
-                max_strike_price = spx_price + 200
-                symbol = strike['call']
-                streamer_symbol = strike['call-streamer-symbol']
-
-            if min_strike_price <= float(strike['strike-price']) <= max_strike_price:
-                # Only add if not already monitoring this symbol
-                if streamer_symbol not in added_streamer_symbols and streamer_symbol not in self.symbols_to_monitor:
-                    self.symbols_to_monitor[streamer_symbol] = Symbol(symbol=symbol, streamer_symbol=streamer_symbol)
+        for strike in strikes[lo:hi]:
+            symbol = strike[symbol_key]
+            streamer_symbol = strike[streamer_symbol_key]
+
+            # Only add if not already monitoring this symbol
+            with self._monitor_lock:
+                if streamer_symbol not in added_streamer_symbols and streamer_symbol not in symbols_to_monitor:
+                    symbols_to_monitor[streamer_symbol] = Symbol(symbol=symbol, streamer_symbol=streamer_symbol)
                     added_streamer_symbols.add(streamer_symbol)
-                
-                option_chain_to_return.append({
-                    'symbol': symbol,
-                    'streamer-symbol': streamer_symbol,
-                    'strike-price': strike['strike-price']
-                })
+            
+            option_chain_to_return.append({
+                'symbol': symbol,
+                'streamer-symbol': streamer_symbol,
+                'strike-price': strike['strike-price']
+            })
         
         # Subscribe to all new symbols at once
         if added_streamer_symbols:
@@ -364,6 +435,161 @@ class TastytradeBroker:
             
         return option_chain_to_return
 
+    def _get_expiration_strikes(self, underlying_symbol: str, expiration_date: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the strikes listed for one expiration of an underlying's option chain.
+
+        The chain is fetched once and the strikes of every expiration in it are
+        reused for OPTION_CHAIN_CACHE_TTL seconds, so repeated strike selection
+        does not refetch and rescan the full chain.
+
+        Args:
+            underlying_symbol: The ticker symbol of the underlying asset.
+            expiration_date: Expiration date in 'YYYY-MM-DD' format.
+
+        Returns:
+            List of strike dictionaries sorted by strike price, or None if retrieval fails.
+        """
+        key = (underlying_symbol, expiration_date)
+        cached = self._option_chain_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.OPTION_CHAIN_CACHE_TTL:
+            fetched_at, strikes, is_sorted = cached
+            if not is_sorted:
+                strikes = self._sort_strikes(strikes)
+                self._option_chain_cache[key] = (fetched_at, strikes, True)
+            return strikes
+
+        option_chain = self.api_client.get_option_chain(underlying_symbol)
+        if not option_chain or "data" not in option_chain:
+            print(f"Failed to retrieve option chain for {underlying_symbol}")
+            return None
+
+        # Index every expiration in the chain by date and cache them all from this one fetch
+        expirations_by_date = {
+            expiration["expiration-date"]: expiration
+            for item in option_chain["data"]["items"]
+            for expiration in item["expirations"]
+        }
+        # Other expirations are cached unsorted and sorted the first time they are requested
+        fetched_at = time.monotonic()
+        for date_str, expiration in expirations_by_date.items():
+            self._option_chain_cache[(underlying_symbol, date_str)] = (fetched_at, expiration["strikes"], False)
+
+        target_expiration = expirations_by_date.get(expiration_date)
+        if not target_expiration:
+            print(f"No expiration found for: {expiration_date}")
+            return None
+        strikes = self._sort_strikes(target_expiration["strikes"])
+        self._option_chain_cache[key] = (fetched_at, strikes, True)
+        return strikes
+
+    @staticmethod
+    def _sort_strikes(strikes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sort one expiration's strikes by price, since strike selection bisects them.
+
+        Args:
+            strikes: Strike dictionaries from the option chain.
+
+        Returns:
+            A new list of the strikes sorted by strike price.
+        """
+        return sorted(strikes, key=lambda strike: float(strike["strike-price"]))
+
+    def subscribe_option_strikes(
+            self,
+            underlying_symbol: str,
+            expiration_date: str,
+            band_pct: float
+    ) -> List[str]:
+        """
+        Stream quotes and Greeks for both sides of every strike near the current price.
+
+        Only strikes within band_pct of the underlying's last price are added, so
+        far out-of-the-money options that can never be selected are not streamed.
+        Waits up to FIRST_GREEKS_TIMEOUT seconds for the new symbols' first Greeks,
+        so strikes can be selected by delta right after this returns.
+
+        Args:
+            underlying_symbol: The ticker symbol of the underlying asset.
+            expiration_date: Expiration date in 'YYYY-MM-DD' format.
+            band_pct: Half-width of the strike band as a fraction of the current price.
+
+        Returns:
+            List of streamer symbols that were newly subscribed.
+        """
+        underlying_data = self.symbols_to_monitor.get(underlying_symbol)
+        if not underlying_data or underlying_data.last_price is None:
+            print(f"Failed to get current {underlying_symbol} price")
+            return []
+
+        strikes = self._get_expiration_strikes(underlying_symbol, expiration_date)
+        if strikes is None:
+            return []
+
+        current_price = underlying_data.last_price
+        strike_prices = [float(strike["strike-price"]) for strike in strikes]
+        lo = bisect_left(strike_prices, current_price * (1 - band_pct))
+        hi = bisect_right(strike_prices, current_price * (1 + band_pct))
+
+        symbols_to_monitor = self.symbols_to_monitor
+        added_streamer_symbols = []
+        with self._monitor_lock:
+            for strike in strikes[lo:hi]:
+                for symbol_key, streamer_symbol_key in (("put", "put-streamer-symbol"), ("call", "call-streamer-symbol")):
+                    streamer_symbol = strike[streamer_symbol_key]
+                    if streamer_symbol not in symbols_to_monitor:
+                        symbols_to_monitor[streamer_symbol] = Symbol(symbol=strike[symbol_key], streamer_symbol=streamer_symbol)
+                        self._first_greeks_events[streamer_symbol] = threading.Event()
+                        added_streamer_symbols.append(streamer_symbol)
+
+        if added_streamer_symbols:
+            self.api_client.subscribe_to_option_quotes(added_streamer_symbols, reset=False)
+            deadline = time.monotonic() + self.FIRST_GREEKS_TIMEOUT
+            for streamer_symbol in added_streamer_symbols:
+                self._first_greeks_events[streamer_symbol].wait(max(0.0, deadline - time.monotonic()))
+        return added_streamer_symbols
+
+    def unsubscribe_option_symbols(self, streamer_symbols: List[str]) -> None:
+        """
+        Stop streaming the given option symbols and drop their tracked data.
+
+        Args:
+            streamer_symbols: Streamer symbols to unsubscribe from.
+        """
+        if not streamer_symbols:
+            return
+
+        with self._monitor_lock:
+            for streamer_symbol in streamer_symbols:
+                self.symbols_to_monitor.pop(streamer_symbol, None)
+                self._first_quote_events.pop(streamer_symbol, None)
+                self._first_greeks_events.pop(streamer_symbol, None)
+        self.api_client.unsubscribe_from_option_quotes(list(streamer_symbols))
+
+    def subscribe_option_quotes(self, streamer_symbols: List[str]) -> None:
+        """
+        Start streaming quotes for several option symbols with one subscription request.
+
+        Symbols that are already streamed are skipped. Exit checks on the
+        subscribed symbols then read streamed prices without waiting for a
+        first quote.
+
+        Args:
+            streamer_symbols: Streamer symbols to subscribe to.
+        """
+        symbols_to_monitor = self.symbols_to_monitor
+        added_streamer_symbols = []
+        with self._monitor_lock:
+            for streamer_symbol in streamer_symbols:
+                if streamer_symbol and streamer_symbol not in symbols_to_monitor:
+                    symbols_to_monitor[streamer_symbol] = Symbol(streamer_symbol=streamer_symbol)
+                    self._first_quote_events[streamer_symbol] = threading.Event()
+                    added_streamer_symbols.append(streamer_symbol)
+
+        if added_streamer_symbols:
+            self.api_client.subscribe_to_option_quotes(added_streamer_symbols, reset=False)
+
     def _fetch_accounts(self) -> None:
         """
         Fetches and creates Account objects for Tastytrade accounts.
@@ -389,28 +615,139 @@ class TastytradeBroker:
         Args:
             account: The Account object to fetch positions for.
         """
-        positions_data = self.api_client.get_positions(account.account_number)
+        positions_data = self._get_positions(account.account_number)
         if positions_data:
+            option_infos = self._get_option_info_batch([pos_data['symbol'] for pos_data in positions_data])
             for pos_data in positions_data:
-                symbol_info = self.api_client.get_option_info(pos_data['symbol'])
-                if not symbol_info or 'data' not in symbol_info or 'streamer-symbol' not in symbol_info['data']:
+                option_data = option_infos.get(pos_data['symbol'])
+                streamer_symbol = option_data.get('streamer-symbol') if option_data else None
+                if not streamer_symbol:
                     print(f"Warning: Could not fetch streamer symbol for {pos_data['symbol']}")
                     continue
                     
                 position = Position(
                     symbol=pos_data['symbol'],
-                    streamer_symbol=symbol_info['data']['streamer-symbol'],
+                    streamer_symbol=streamer_symbol,
                     underlying_symbol=pos_data['underlying-symbol'],
                     instrument_type=pos_data['instrument-type'],
                     quantity=pos_data['quantity'],
                     direction=pos_data['quantity-direction'],
                     cost_effect=pos_data['cost-effect'],
-                    average_cost=pos_data['average-open-price']
+                    average_cost=pos_data['average-open-price'],
+                    option_type=option_data.get('option-type')
                 )
                 account.add_position(position)
         else:
              print(f"Warning: Could not fetch positions for account: {account.account_number} in {self.name} broker")
 
+    def _get_positions(self, account_number: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get positions for an account, reusing a recent response if available.
+        
+        Args:
+            account_number: The account number to retrieve positions for.
+            
+        Returns:
+            A list of position data dictionaries or None if retrieval fails.
+        """
+        cached = self._positions_cache.get(account_number)
+        if cached and time.monotonic() - cached[0] < self.POSITIONS_CACHE_TTL:
+            return cached[1]
+
+        positions = self.api_client.get_positions(account_number)
+        if positions is not None:
+            self._positions_cache[account_number] = (time.monotonic(), positions)
+        return positions
+
+    def _get_option_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get instrument data for an option symbol, using the local cache when possible.
+        
+        Args:
+            symbol: The option symbol to look up.
+            
+        Returns:
+            The option instrument data dictionary, or None if retrieval fails.
+        """
+        cached = self._option_info_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self.OPTION_INFO_CACHE_TTL:
+            return cached[1]
+
+        option_info = self.api_client.get_option_info(symbol)
+        if not option_info or "data" not in option_info:
+            return None
+
+        option_data = option_info["data"]
+        self._cache_option_info(symbol, option_data)
+        return option_data
+
+    def _get_option_info_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get instrument data for several option symbols with a single request.
+        
+        Cached symbols are served locally and the rest are fetched together.
+        If the bulk request fails, the remaining symbols are looked up
+        individually on the broker's worker pool.
+        
+        Args:
+            symbols: The option symbols to look up.
+            
+        Returns:
+            Map of option symbol to instrument data for every symbol that was resolved.
+        """
+        option_infos: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        now = time.monotonic()
+        for symbol in dict.fromkeys(symbols):
+            cached = self._option_info_cache.get(symbol)
+            if cached and now - cached[0] < self.OPTION_INFO_CACHE_TTL:
+                option_infos[symbol] = cached[1]
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return option_infos
+
+        response = self.api_client.get_option_info(missing)
+        if response and "data" in response and "items" in response["data"]:
+            for option_data in response["data"]["items"]:
+                self._cache_option_info(option_data["symbol"], option_data)
+                option_infos[option_data["symbol"]] = option_data
+        else:
+            for symbol, option_data in zip(missing, self._executor.map(self._get_option_info, missing)):
+                if option_data:
+                    option_infos[symbol] = option_data
+
+        return option_infos
+
+    def _cache_option_info(self, symbol: str, option_data: Dict[str, Any]) -> None:
+        """
+        Store instrument data for an option symbol in the local cache.
+        
+        Args:
+            symbol: The option symbol.
+            option_data: The instrument data returned by the API.
+        """
+        self._option_info_cache[symbol] = (time.monotonic(), option_data)
+        if option_data.get("streamer-symbol"):
+            self._symbol_to_streamer[symbol] = option_data["streamer-symbol"]
+
+    def _get_streamer_symbol(self, symbol: str) -> Optional[str]:
+        """
+        Resolve the streamer symbol for an option symbol.
+        
+        Args:
+            symbol: The option symbol to resolve.
+            
+        Returns:
+            The streamer symbol, or None if it could not be resolved.
+        """
+        streamer_symbol = self._symbol_to_streamer.get(symbol)
+        if streamer_symbol is None:
+            option_data = self._get_option_info(symbol)
+            streamer_symbol = option_data.get("streamer-symbol") if option_data else None
+        return streamer_symbol
+
     def get_option_strikes_by_delta(
             self,
             underlying_symbol: str,
@@ -430,62 +767,36 @@ class TastytradeBroker:
         Returns:
             Dictionary with selected strikes and option chain information.
         """
-        # Get option chain
-        option_chain_data = self.api_client.get_option_chain(underlying_symbol)
-        if not option_chain_data or "data" not in option_chain_data:
-            print(f"Failed to retrieve option chain for {underlying_symbol}")
+        # Get the strikes listed for the expiration
+        strikes = self._get_expiration_strikes(underlying_symbol, expiration_date)
+        if strikes is None:
             return {}
 
-        option_chain = option_chain_data["data"]
-
         # Extract current price
         quote_data = self.symbols_to_monitor.get(underlying_symbol)
         if not quote_data or not quote_data.prices:
             print(f"Failed to get current {underlying_symbol} price")
             return {}
 
-        current_price = quote_data.prices[-1].last_price
-
-        # Find specified expiration in the chain
-        target_expiration = None
-        for item in option_chain["items"]:
-            for exp in item["expirations"]:
-                if exp["expiration-date"] == expiration_date:
-                    target_expiration = exp
-                    break
-            if target_expiration:
-                break
-
-        if not target_expiration:
-            print(f"No expiration found for: {expiration_date}")
-            return {}
+        current_price = quote_data.last_price
 
         # Process all strikes
         all_strikes = []
-        for strike in target_expiration["strikes"]:
-            strike_price = float(strike["strike-price"])
-
+        symbols_to_monitor = self.symbols_to_monitor
+        for strike in strikes:
             # Get option data for this strike
-            put_symbol = strike["put"]
-            call_symbol = strike["call"]
-            put_streamer_symbol = strike["put-streamer-symbol"]
-            call_streamer_symbol = strike["call-streamer-symbol"]
-
-            # Check if we have Greeks data for these options
-            put_delta = None
-            call_delta = None
-
-            # Check in monitored symbols
-            if put_streamer_symbol in self.symbols_to_monitor:
-                put_data = self.symbols_to_monitor[put_streamer_symbol]
-                if put_data.greeks and put_data.greeks[-1].delta is not None:
-                    # Put deltas are negative, take absolute value for comparison
-                    put_delta = abs(put_data.greeks[-1].delta)
-
-            if call_streamer_symbol in self.symbols_to_monitor:
-                call_data = self.symbols_to_monitor[call_streamer_symbol]
-                if call_data.greeks and call_data.greeks[-1].delta is not None:
-                    call_delta = call_data.greeks[-1].delta
+            strike_price, put_symbol, call_symbol, put_streamer_symbol, call_streamer_symbol = _get_strike_fields(strike)
+            strike_price = float(strike_price)
+
+            # Check if we have Greeks data for these options (one lookup per monitored symbol)
+            put_data = symbols_to_monitor.get(put_streamer_symbol)
+            put_delta = put_data.last_delta if put_data is not None else None
+            if put_delta is not None:
+                # Put deltas are negative, take absolute value for comparison
+                put_delta = abs(put_delta)
+
+            call_data = symbols_to_monitor.get(call_streamer_symbol)
+            call_delta = call_data.last_delta if call_data is not None else None
 
             # Store strike with delta information
             all_strikes.append({
@@ -501,30 +812,29 @@ class TastytradeBroker:
         # Sort strikes by price
         all_strikes.sort(key=lambda x: x["strike_price"])
 
-        # Find put strikes within delta range
-        put_strikes = [s for s in all_strikes if s["put_delta"] is not None and
-                       delta_min <= s["put_delta"] <= delta_max and
-                       s["strike_price"] < current_price]
+        # Split the sorted strikes at the current price and walk outward from it, so the
+        # first match on each side is the nearest strike within the delta range
+        strike_prices = [s["strike_price"] for s in all_strikes]
+        put_end = bisect_left(strike_prices, current_price)
+        call_start = bisect_right(strike_prices, current_price)
+
+        # Select short put (highest strike below the price within delta range)
+        short_put = next((s for s in reversed(all_strikes[:put_end]) if s["put_delta"] is not None and
+                          delta_min <= s["put_delta"] <= delta_max), None)
 
-        # Find call strikes within delta range
-        call_strikes = [s for s in all_strikes if s["call_delta"] is not None and
-                        delta_min <= s["call_delta"] <= delta_max and
-                        s["strike_price"] > current_price]
+        # Select short call (lowest strike above the price within delta range)
+        short_call = next((s for s in all_strikes[call_start:] if s["call_delta"] is not None and
+                           delta_min <= s["call_delta"] <= delta_max), None)
 
-        if not put_strikes:
+        if short_put is None:
             print("No suitable put strikes found in delta range")
             return {}
 
-        if not call_strikes:
+        if short_call is None:
             print("No suitable call strikes found in delta range")
             return {}
 
-        # Select short put (highest strike within delta range)
-        short_put = put_strikes[-1]
         short_put_strike = short_put["strike_price"]
-
-        # Select short call (lowest strike within delta range)
-        short_call = call_strikes[0]
         short_call_strike = short_call["strike_price"]
 
         return {
@@ -575,10 +885,12 @@ class TastytradeBroker:
         short_put_strike = strikes["short_put_strike"]
         short_call_strike = strikes["short_call_strike"]
 
+        # Index strikes by price once; the short strikes were taken from this same list
+        strike_index = {s["strike_price"]: i for i, s in enumerate(all_strikes)}
+
         # Find long put strike (enough spread for desired credit)
         put_spread = int(target_put_credit / put_wing_cost)
-        long_put_index = next((i for i, s in enumerate(all_strikes)
-                               if s["strike_price"] == short_put_strike), None)
+        long_put_index = strike_index.get(short_put_strike)
 
         if long_put_index is not None and long_put_index >= put_spread:
             long_put_strike = all_strikes[long_put_index - put_spread]["strike_price"]
@@ -588,8 +900,7 @@ class TastytradeBroker:
 
         # Find long call strike (enough spread for desired credit)
         call_spread = int(target_call_credit / call_wing_cost)
-        short_call_index = next((i for i, s in enumerate(all_strikes)
-                                 if s["strike_price"] == short_call_strike), None)
+        short_call_index = strike_index.get(short_call_strike)
 
         if short_call_index is not None and short_call_index + call_spread < len(all_strikes):
             long_call_strike = all_strikes[short_call_index + call_spread]["strike_price"]
@@ -635,7 +946,7 @@ class TastytradeBroker:
             return 0
 
         # Get available buying power
-        available_bp = self.api_client.get_available_buying_power(account_number)
+        available_bp = self._get_available_buying_power(account_number)
 
         if available_bp is None:
             print("Could not retrieve account buying power, using max cap")
@@ -667,6 +978,28 @@ class TastytradeBroker:
         # Cap at our desired maximum
         return min(max_possible_contracts, max_contracts)
 
+    def _get_available_buying_power(self, account_number: str) -> Optional[float]:
+        """
+        Get an account's available derivative buying power.
+
+        The balance is fetched once and reused for BUYING_POWER_CACHE_TTL seconds.
+        Placing or closing an order through the broker drops the cached value.
+
+        Args:
+            account_number: The account number to retrieve buying power for.
+
+        Returns:
+            Available buying power as a float, or None if retrieval fails.
+        """
+        cached = self._buying_power_cache.get(account_number)
+        if cached and time.monotonic() - cached[0] < self.BUYING_POWER_CACHE_TTL:
+            return cached[1]
+
+        available_bp = self.api_client.get_available_buying_power(account_number)
+        if available_bp is not None:
+            self._buying_power_cache[account_number] = (time.monotonic(), available_bp)
+        return available_bp
+
     def scan_for_iron_condor_positions(
             self,
             account_number: str,
@@ -690,10 +1023,10 @@ class TastytradeBroker:
 
         # Use today's date as default expiration if not specified
         if expiration_date is None:
-            expiration_date = datetime.date.today().strftime("%Y-%m-%d")
+            expiration_date = date.today().strftime("%Y-%m-%d")
 
         # Get current positions
-        positions = self.api_client.get_positions(account_number)
+        positions = self._get_positions(account_number)
         if not positions:
             return []
 
@@ -701,100 +1034,103 @@ class TastytradeBroker:
         streamer_symbols_to_monitor = set()
 
         # Group positions by expiration date
-        positions_by_expiration = {}
-
-        for position in positions:
-            if position["underlying-symbol"] == underlying_symbol and position["instrument-type"] == "Equity Option":
-                # Get option details
-                option_info = self.api_client.get_option_info(position["symbol"])
-                if not option_info or "data" not in option_info:
-                    continue
-
-                option_data = option_info["data"]
-                position_expiration = option_data.get("expiration-date")
-
-                # Add to streaming service
-                streamer_symbol = option_data.get("streamer-symbol")
-                if streamer_symbol:
-                    streamer_symbols_to_monitor.add(streamer_symbol)
-
-                # Focus only on specified expiration
-                if position_expiration != expiration_date:
-                    continue
+        positions_by_expiration = defaultdict(list)
 
-                if position_expiration not in positions_by_expiration:
-                    positions_by_expiration[position_expiration] = []
+        option_positions = [
+            position for position in positions
+            if position["underlying-symbol"] == underlying_symbol and position["instrument-type"] == "Equity Option"
+        ]
 
-                positions_by_expiration[position_expiration].append({
-                    "symbol": position["symbol"],
-                    "quantity": position["quantity"],
-                    "direction": position["quantity-direction"],
-                    "option_type": option_data.get("option-type"),
-                    "strike_price": float(option_data.get("strike-price")),
-                    "streamer_symbol": streamer_symbol,
-                    "average_open_price": float(position.get("average-open-price", 0))
-                })
+        # Resolve option details for every position with one request
+        option_infos = self._get_option_info_batch([position["symbol"] for position in option_positions])
+
+        for position in option_positions:
+            # Get option details
+            option_data = option_infos.get(position["symbol"])
+            if not option_data:
+                continue
+
+            position_expiration = option_data.get("expiration-date")
+
+            # Add to streaming service
+            streamer_symbol = option_data.get("streamer-symbol")
+            if streamer_symbol:
+                streamer_symbols_to_monitor.add(streamer_symbol)
+
+            # Focus only on specified expiration
+            if position_expiration != expiration_date:
+                continue
+
+            positions_by_expiration[position_expiration].append({
+                "symbol": position["symbol"],
+                "quantity": position["quantity"],
+                "direction": position["quantity-direction"],
+                "option_type": option_data.get("option-type"),
+                "strike_price": float(option_data.get("strike-price")),
+                "streamer_symbol": streamer_symbol,
+                "average_open_price": float(position.get("average-open-price", 0))
+            })
 
         # Add all streamer symbols to monitoring if not already monitored
-        for streamer_symbol in streamer_symbols_to_monitor:
-            if streamer_symbol not in self.symbols_to_monitor:
-                self.symbols_to_monitor[streamer_symbol] = Symbol(symbol=None, streamer_symbol=streamer_symbol)
+        with self._monitor_lock:
+            missing_streamer_symbols = streamer_symbols_to_monitor - self.symbols_to_monitor.keys()
+            self.symbols_to_monitor.update(
+                (streamer_symbol, Symbol(symbol=None, streamer_symbol=streamer_symbol))
+                for streamer_symbol in missing_streamer_symbols
+            )
 
         # List to hold identified iron condors
         iron_condors = []
 
         # Identify iron condor structures
         for expiration, positions in positions_by_expiration.items():
-            # Find puts and calls
-            puts = [p for p in positions if p["option_type"] == "P"]
-            calls = [p for p in positions if p["option_type"] == "C"]
-
-            # Sort by strike
-            puts.sort(key=lambda x: x["strike_price"])
-            calls.sort(key=lambda x: x["strike_price"])
+            # Partition legs by option type and direction in a single pass
+            long_puts, short_puts, long_calls, short_calls = [], [], [], []
+            buckets = {
+                ("P", "Long"): long_puts,
+                ("P", "Short"): short_puts,
+                ("C", "Long"): long_calls,
+                ("C", "Short"): short_calls
+            }
+            for p in positions:
+                bucket = buckets.get((p["option_type"], p["direction"]))
+                if bucket is not None:
+                    bucket.append(p)
 
             # Look for iron condor structure
-            long_puts = [p for p in puts if p["direction"] == "Long"]
-            short_puts = [p for p in puts if p["direction"] == "Short"]
-            long_calls = [p for p in calls if p["direction"] == "Long"]
-            short_calls = [p for p in calls if p["direction"] == "Short"]
-
             if long_puts and short_puts and long_calls and short_calls:
+                # Use the lowest strike leg of each kind
+                long_put = min(long_puts, key=lambda x: x["strike_price"])
+                short_put = min(short_puts, key=lambda x: x["strike_price"])
+                long_call = min(long_calls, key=lambda x: x["strike_price"])
+                short_call = min(short_calls, key=lambda x: x["strike_price"])
+
                 # Found a potential iron condor
                 print(f"Found existing iron condor position for expiration {expiration}")
 
-                # Get order history to estimate entry time and credits
-                orders = self.api_client.get_orders(
-                    account_number,
-                    status="all",
-                    start_date=datetime.date.today() - datetime.timedelta(days=7)
-                )
-
-                # Look for orders with the same symbols
-                relevant_orders = []
-                if orders and "data" in orders and "items" in orders["data"]:
-                    for order in orders["data"]["items"]:
-                        # Check if this is a related order
-                        if "legs" in order:
-                            order_symbols = [leg.get("symbol") for leg in order["legs"]]
-                            if (short_puts[0]["symbol"] in order_symbols and
-                                    long_puts[0]["symbol"] in order_symbols and
-                                    short_calls[0]["symbol"] in order_symbols and
-                                    long_calls[0]["symbol"] in order_symbols):
-                                relevant_orders.append(order)
+                # Look for orders with the same symbols to estimate entry time and credits
+                relevant_orders = self._get_order_leg_index(account_number).get(frozenset((
+                    short_put["symbol"],
+                    long_put["symbol"],
+                    short_call["symbol"],
+                    long_call["symbol"]
+                )), [])
 
                 # Estimate entry time and credits
-                entry_time = datetime.datetime.now() - datetime.timedelta(hours=1)  # Default estimate
+                entry_time = datetime.now() - timedelta(hours=1)  # Default estimate
                 total_credit = 0.0  # Default estimate
 
                 # If we found the original order, use its details
                 if relevant_orders:
-                    # Use the oldest order as the entry
+                    # Use the oldest order as the entry. ISO-8601 timestamps sort lexicographically,
+                    # so only the winning order's placed-time needs to be parsed.
                     oldest_order = min(relevant_orders, key=lambda o: o.get("placed-time", ""))
-                    if "placed-time" in oldest_order:
+                    placed_time = oldest_order.get("placed-time")
+                    if placed_time:
+                        if placed_time[-1] == "Z":
+                            placed_time = placed_time[:-1] + "+00:00"
                         try:
-                            entry_time = datetime.datetime.fromisoformat(
-                                oldest_order["placed-time"].replace("Z", "+00:00"))
+                            entry_time = datetime.fromisoformat(placed_time)
                         except ValueError:
                             pass  # Fall back to estimate
 
@@ -802,12 +1138,13 @@ class TastytradeBroker:
                     if "price" in oldest_order:
                         total_credit = float(oldest_order["price"])
 
-                # Calculate number of contracts (minimum quantity across all legs)
+                # Calculate number of contracts (minimum quantity across all legs).
+                # Quantities are unsigned; the side is carried by quantity-direction.
                 num_contracts = min(
-                    abs(long_puts[0]["quantity"]),
-                    abs(short_puts[0]["quantity"]),
-                    abs(short_calls[0]["quantity"]),
-                    abs(long_calls[0]["quantity"])
+                    long_put["quantity"],
+                    short_put["quantity"],
+                    short_call["quantity"],
+                    long_call["quantity"]
                 )
 
                 # Create a iron condor structure for monitoring
@@ -818,22 +1155,22 @@ class TastytradeBroker:
                     "entry_time": entry_time,
                     "total_credit": total_credit * num_contracts,
                     "strikes": {
-                        "long_put": long_puts[0]["strike_price"],
-                        "short_put": short_puts[0]["strike_price"],
-                        "short_call": short_calls[0]["strike_price"],
-                        "long_call": long_calls[0]["strike_price"]
+                        "long_put": long_put["strike_price"],
+                        "short_put": short_put["strike_price"],
+                        "short_call": short_call["strike_price"],
+                        "long_call": long_call["strike_price"]
                     },
                     "symbols": {
-                        "long_put": long_puts[0]["symbol"],
-                        "short_put": short_puts[0]["symbol"],
-                        "short_call": short_calls[0]["symbol"],
-                        "long_call": long_calls[0]["symbol"]
+                        "long_put": long_put["symbol"],
+                        "short_put": short_put["symbol"],
+                        "short_call": short_call["symbol"],
+                        "long_call": long_call["symbol"]
                     },
                     "streamer_symbols": {
-                        "long_put": long_puts[0]["streamer_symbol"],
-                        "short_put": short_puts[0]["streamer_symbol"],
-                        "short_call": short_calls[0]["streamer_symbol"],
-                        "long_call": long_calls[0]["streamer_symbol"]
+                        "long_put": long_put["streamer_symbol"],
+                        "short_put": short_put["streamer_symbol"],
+                        "short_call": short_call["streamer_symbol"],
+                        "long_call": long_call["streamer_symbol"]
                     }
                 }
 
@@ -841,6 +1178,37 @@ class TastytradeBroker:
 
         return iron_condors
 
+    def _get_order_leg_index(self, account_number: str) -> Dict[FrozenSet[str], List[Dict[str, Any]]]:
+        """
+        Get the last 7 days of orders indexed by the set of leg symbols in each order.
+
+        The order history is fetched once and reused for ORDERS_CACHE_TTL seconds.
+
+        Args:
+            account_number: The account number to retrieve orders for.
+
+        Returns:
+            Map of leg-symbol sets to the orders with exactly those legs.
+        """
+        cached = self._order_leg_index_cache.get(account_number)
+        if cached and time.monotonic() - cached[0] < self.ORDERS_CACHE_TTL:
+            return cached[1]
+
+        orders = self.api_client.get_orders(
+            account_number,
+            status="all",
+            start_date=date.today() - timedelta(days=7)
+        )
+
+        order_leg_index: Dict[FrozenSet[str], List[Dict[str, Any]]] = {}
+        if orders and "data" in orders and "items" in orders["data"]:
+            for order in orders["data"]["items"]:
+                if "legs" in order:
+                    leg_symbols = frozenset(leg.get("symbol") for leg in order["legs"])
+                    order_leg_index.setdefault(leg_symbols, []).append(order)
+            self._order_leg_index_cache[account_number] = (time.monotonic(), order_leg_index)
+        return order_leg_index
+
     def execute_iron_condor(
             self,
             account_number: str,
@@ -889,17 +1257,24 @@ class TastytradeBroker:
              "instrument_type": "Equity Option"}
         ]
 
-        # Do a dry run to confirm everything looks good
-        dry_run_result = self.api_client.dry_run_option_order(
-            account_number, underlying_symbol, legs, order_type="Limit", limit_price=credit_price)
+        # Do a dry run to confirm everything looks good, unless an identical order passed one recently
+        dry_run_key = (account_number, underlying_symbol, expiration_date,
+                       strikes["long_put_strike"], strikes["short_put_strike"],
+                       strikes["short_call_strike"], strikes["long_call_strike"], num_contracts)
+        dry_run_time = self._dry_run_cache.get(dry_run_key)
+        if dry_run_time is None or time.monotonic() - dry_run_time >= self.DRY_RUN_CACHE_TTL:
+            dry_run_result = self.api_client.dry_run_option_order(
+                account_number, underlying_symbol, legs, order_type="Limit", limit_price=credit_price)
 
-        if not dry_run_result:
-            print("Dry run failed, cancelling trade")
-            return {}
+            if not dry_run_result:
+                print("Dry run failed, cancelling trade")
+                return {}
 
-        if "errors" in dry_run_result and dry_run_result["errors"]:
-            print(f"Dry run returned errors: {dry_run_result['errors']}")
-            return {}
+            if "errors" in dry_run_result and dry_run_result["errors"]:
+                print(f"Dry run returned errors: {dry_run_result['errors']}")
+                return {}
+
+            self._dry_run_cache[dry_run_key] = time.monotonic()
 
         # Submit the actual order
         response = self.api_client.create_iron_condor_order(
@@ -918,14 +1293,22 @@ class TastytradeBroker:
 
         order = response["data"]["order"]
         order_id = order["id"]
+        self._buying_power_cache.pop(account_number, None)  # The new order consumes buying power
+
+        # Carry the legs' streamer symbols from the chain so monitoring needs no instrument lookups
+        strikes_by_price = {s["strike_price"]: s for s in strikes.get("all_strikes", [])}
+        long_put_chain = strikes_by_price.get(strikes["long_put_strike"], {})
+        short_put_chain = strikes_by_price.get(strikes["short_put_strike"], {})
+        short_call_chain = strikes_by_price.get(strikes["short_call_strike"], {})
+        long_call_chain = strikes_by_price.get(strikes["long_call_strike"], {})
 
         # Build trade info
         trade_info = {
             "order_id": order_id,
             "num_contracts": num_contracts,
             "expiration_date": expiration_date,
-            "entry_time": datetime.datetime.now(),
-            "total_credit": credit_price * num_contracts,
+            "entry_time": datetime.now(),
+            "total_credit": float(credit_price) * num_contracts,
             "strikes": {
                 "long_put": strikes["long_put_strike"],
                 "short_put": strikes["short_put_strike"],
@@ -937,6 +1320,12 @@ class TastytradeBroker:
                 "short_put": short_put,
                 "short_call": short_call,
                 "long_call": long_call
+            },
+            "streamer_symbols": {
+                "long_put": long_put_chain.get("put_streamer_symbol"),
+                "short_put": short_put_chain.get("put_streamer_symbol"),
+                "short_call": short_call_chain.get("call_streamer_symbol"),
+                "long_call": long_call_chain.get("call_streamer_symbol")
             }
         }
 
@@ -947,8 +1336,9 @@ class TastytradeBroker:
             symbol: str,
             original_credit: float,
             num_contracts: int,
-            exit_threshold: float
-    ) -> Tuple[bool, float]:
+            exit_threshold: float,
+            streamer_symbol: Optional[str] = None
+    ) -> Tuple[bool, Optional[float]]:
         """
         Check if an option position meets exit conditions based on cost to close.
 
@@ -957,26 +1347,26 @@ class TastytradeBroker:
             original_credit: Original credit received per contract.
             num_contracts: Number of contracts.
             exit_threshold: Threshold as percentage of original credit.
+            streamer_symbol: Optional streamer symbol for the option, if already known.
+                Skips the instrument lookup used to resolve it.
 
         Returns:
-            Tuple of (should_exit, cost_to_close).
+            Tuple of (should_exit, cost_to_close). cost_to_close is None when no
+            price is available for the option yet.
         """
-        option_info = self.api_client.get_option_info(symbol)
-
-        if not option_info or "data" not in option_info:
-            return False, 0.0
-
-        streamer_symbol = option_info["data"]["streamer-symbol"]
-
-        # Check if we have price data
-        if streamer_symbol not in self.symbols_to_monitor:
-            return False, 0.0
-
-        symbol_data = self.symbols_to_monitor[streamer_symbol]
-        if not symbol_data.prices:
-            return False, 0.0
-
-        current_price = symbol_data.prices[-1].ask_price
+        if not streamer_symbol:
+            streamer_symbol = self._get_streamer_symbol(symbol)
+        if not streamer_symbol:
+            return False, None
+
+        # Check if we have price data, subscribing to the stream if we never have
+        symbol_data = self.symbols_to_monitor.get(streamer_symbol)
+        if not symbol_data or not symbol_data.prices:
+            symbol_data = self._await_first_quote(streamer_symbol)
+            if not symbol_data:
+                return False, None
+
+        current_price = symbol_data.last_ask
         cost_to_close = current_price * num_contracts
 
         # Check if cost to close exceeds threshold
@@ -985,6 +1375,62 @@ class TastytradeBroker:
 
         return False, cost_to_close
 
+    def check_option_exit_conditions(
+            self,
+            legs: List[Tuple[Any, ...]],
+            exit_threshold: float
+    ) -> List[Tuple[bool, Optional[float]]]:
+        """
+        Check exit conditions for several option positions concurrently.
+
+        Each leg is evaluated with check_option_exit_condition on the broker's
+        worker pool, so any instrument lookups or first-quote waits overlap
+        instead of running back to back.
+
+        Args:
+            legs: (symbol, original_credit, num_contracts) for each position to check,
+                optionally followed by the option's streamer symbol.
+            exit_threshold: Threshold as percentage of original credit.
+
+        Returns:
+            List of (should_exit, cost_to_close) tuples in the same order as legs,
+            with cost_to_close None for legs that have no price yet.
+        """
+        def check_leg(leg: Tuple[Any, ...]) -> Tuple[bool, Optional[float]]:
+            symbol, original_credit, num_contracts = leg[:3]
+            return self.check_option_exit_condition(
+                symbol, original_credit, num_contracts, exit_threshold,
+                streamer_symbol=leg[3] if len(leg) > 3 else None)
+
+        return list(self._executor.map(check_leg, legs))
+
+    def _await_first_quote(self, streamer_symbol: str) -> Optional[Symbol]:
+        """
+        Subscribe to quotes for a symbol with no price data and wait briefly for the first tick.
+
+        The subscription and wait only happen once per symbol; later calls
+        return immediately and rely on the stream to fill in prices.
+
+        Args:
+            streamer_symbol: The streamer symbol to subscribe to.
+
+        Returns:
+            The Symbol with price data, or None if no quote has arrived yet.
+        """
+        first_quote_event = None
+        with self._monitor_lock:
+            if streamer_symbol not in self._first_quote_events:
+                first_quote_event = threading.Event()
+                self._first_quote_events[streamer_symbol] = first_quote_event
+                if streamer_symbol not in self.symbols_to_monitor:
+                    self.symbols_to_monitor[streamer_symbol] = Symbol(streamer_symbol=streamer_symbol)
+        if first_quote_event is not None:
+            self.api_client.subscribe_to_option_quotes([streamer_symbol], reset=False)
+            first_quote_event.wait(self.FIRST_QUOTE_TIMEOUT)
+
+        symbol_data = self.symbols_to_monitor.get(streamer_symbol)
+        return symbol_data if symbol_data and symbol_data.prices else None
+
     def close_option_position(
             self,
             account_number: str,
@@ -1015,6 +1461,42 @@ class TastytradeBroker:
         )
 
         if response and "data" in response and "order" in response["data"]:
+            self.invalidate_option_info(symbol)
+            self._buying_power_cache.pop(account_number, None)  # Closing releases buying power
             return response["data"]["order"]["id"]
 
         return None
+
+    def submit_close_option_position(
+            self,
+            account_number: str,
+            symbol: str,
+            quantity: int,
+            action: str = "Buy to Close",
+            order_type: str = "Market"
+    ) -> "Future[Optional[str]]":
+        """
+        Submit a close order on the broker's worker pool without waiting for the response.
+
+        Args:
+            account_number: The account number.
+            symbol: The option symbol to close.
+            quantity: Number of contracts.
+            action: Order action (usually 'Buy to Close' for short options).
+            order_type: Order type (usually 'Market' for closing).
+
+        Returns:
+            Future that resolves to the order ID if successful, None otherwise.
+        """
+        return self._executor.submit(
+            self.close_option_position, account_number, symbol, quantity, action, order_type)
+
+    def invalidate_option_info(self, symbol: str) -> None:
+        """
+        Drop cached instrument data for an option symbol.
+
+        Args:
+            symbol: The option symbol to remove from the cache.
+        """
+        self._option_info_cache.pop(symbol, None)
+        self._symbol_to_streamer.pop(symbol, None)
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime
 
 
@@ -6,7 +7,8 @@ class Greeks:
     Represents the Greek values for an options contract at a point in time.
     
     Attributes:
-        datetime (datetime): Timestamp when this data was recorded.
+        timestamp_ns (int): Wall-clock time in nanoseconds when this data was recorded.
+        datetime (datetime): timestamp_ns converted to a datetime.
         volatility (float): Implied volatility.
         delta (float): Rate of change of option price with respect to underlying price.
         gamma (float): Rate of change of delta with respect to underlying price.
@@ -15,6 +17,16 @@ class Greeks:
         vega (float): Rate of change of option price with respect to volatility.
     """
 
+    __slots__ = (
+        'timestamp_ns',
+        'volatility',
+        'delta',
+        'gamma',
+        'theta',
+        'rho',
+        'vega',
+    )
+
     def __init__(
         self, 
         volatility: float, 
@@ -35,10 +47,20 @@ class Greeks:
             rho: Rate of change of option price with respect to interest rate.
             vega: Rate of change of option price with respect to volatility.
         """
-        self.datetime = datetime.now()
+        self.timestamp_ns = time.time_ns()  # Cheaper than building a datetime on every tick
         self.volatility = volatility
         self.delta = delta
         self.gamma = gamma
         self.theta = theta
         self.rho = rho
         self.vega = vega
+
+    @property
+    def datetime(self) -> datetime:
+        """
+        Timestamp when this data was recorded.
+
+        Returns:
+            datetime: Local time built from timestamp_ns.
+        """
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
@@ -21,6 +21,19 @@ class Position:
         market_value (float): Current market value of the position.
     """
 
+    __slots__ = (
+        'symbol',
+        'streamer_symbol',
+        'option_type',
+        'underlying_symbol',
+        'instrument_type',
+        'quantity',
+        'direction',
+        'cost_effect',
+        'average_cost',
+        'market_value',
+    )
+
     def __init__(
             self,
             symbol: str,
@@ -30,7 +43,8 @@ class Position:
             quantity: int,
             direction: str,
             cost_effect: str,
-            average_cost: float
+            average_cost: float,
+            option_type: Optional[str] = None
     ) -> None:
         """
         Initialize a Position instance.
@@ -44,16 +58,17 @@ class Position:
             direction: Position direction ('LONG' or 'SHORT').
             cost_effect: Cost effect of the position.
             average_cost: Average cost basis per contract/share.
+            option_type: Option type ('C' or 'P') as reported by the instrument lookup.
+                If None, it is parsed from the OCC symbol.
         """
         self.symbol = symbol
         self.streamer_symbol = streamer_symbol
-        # Extract option type from symbol if it's an option
-        # SPX   250321C06100000
-        # 012345678901234567890
-        if len(symbol) >= 15:
-            self.option_type: Optional[str] = symbol[12]
-        else:
-            self.option_type = None
+        if option_type is None and len(symbol) >= 15:
+            # Extract option type from symbol if it's an option
+            # SPX   250321C06100000
+            # 012345678901234567890
+            option_type = symbol[12]
+        self.option_type = option_type
         self.underlying_symbol = underlying_symbol
         self.instrument_type = instrument_type
         self.quantity = quantity
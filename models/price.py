@@ -1,3 +1,4 @@
+import time
 from datetime import datetime
 
 
@@ -6,7 +7,8 @@ class Price:
     Represents price data for a financial instrument at a point in time.
     
     Attributes:
-        datetime (datetime): Timestamp when this price data was recorded.
+        timestamp_ns (int): Wall-clock time in nanoseconds when this price data was recorded.
+        datetime (datetime): timestamp_ns converted to a datetime.
         bid_price (float): Current bid price.
         ask_price (float): Current ask price.
         midpoint_price (float): Calculated midpoint between bid and ask.
@@ -15,6 +17,16 @@ class Price:
         last_price (float): Price of the most recent trade.
     """
 
+    __slots__ = (
+        'timestamp_ns',
+        'bid_price',
+        'ask_price',
+        'midpoint_price',
+        'bid_size',
+        'ask_size',
+        'last_price',
+    )
+
     def __init__(
         self, 
         bid_price: float, 
@@ -33,10 +45,20 @@ class Price:
             ask_size: Size of the ask.
             last_price: Price of the most recent trade.
         """
-        self.datetime = datetime.now()
+        self.timestamp_ns = time.time_ns()  # Cheaper than building a datetime on every tick
         self.bid_price = bid_price
         self.ask_price = ask_price
         self.midpoint_price = (bid_price + ask_price) / 2.0
         self.bid_size = bid_size
         self.ask_size = ask_size
         self.last_price = last_price
+
+    @property
+    def datetime(self) -> datetime:
+        """
+        Timestamp when this data was recorded.
+
+        Returns:
+            datetime: Local time built from timestamp_ns.
+        """
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
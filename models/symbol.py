@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Tuple
 from .price import Price
 from .greeks import Greeks
 
@@ -14,14 +15,41 @@ class Symbol:
         symbol (str): The option or equity symbol.
         streamer_symbol (str): The symbol used by the streaming service.
         max_history (int): Maximum number of historical data points to keep.
-        prices (List[Price]): Historical price data.
+        prices (Deque[Price]): Historical price data, bounded to max_history entries.
+        last_bid (Optional[float]): Bid price from the most recent quote.
+        last_ask (Optional[float]): Ask price from the most recent quote.
+        last_price (Optional[float]): Last price from the most recent quote.
         price_sma (float): Simple moving average of midpoint prices.
         trading_range (float): Difference between highest ask and lowest bid.
-        greeks (List[Greeks]): Historical Greeks data.
+        greeks (Deque[Greeks]): Historical Greeks data, bounded to max_history entries.
+        last_delta (Optional[float]): Delta from the most recent Greeks update.
         volatility_sma (float): Simple moving average of volatility.
         delta_sma (float): Simple moving average of delta.
     """
 
+    __slots__ = (
+        'symbol',
+        'streamer_symbol',
+        'max_history',
+        'prices',
+        'last_bid',
+        'last_ask',
+        'last_price',
+        'price_sma',
+        'trading_range',
+        'is_trending_up',
+        'greeks',
+        'last_delta',
+        'volatility_sma',
+        'delta_sma',
+        '_price_sum',
+        '_price_ticks',
+        '_ask_max_window',
+        '_bid_min_window',
+        '_volatility_sum',
+        '_delta_sum',
+    )
+
     def __init__(
         self, 
         symbol: Optional[str] = None, 
@@ -40,46 +68,74 @@ class Symbol:
         self.streamer_symbol = streamer_symbol
         self.max_history = max_history
 
-        self.prices: List[Price] = []
+        self.prices: Deque[Price] = deque(maxlen=max_history)
+        self.last_bid: Optional[float] = None
+        self.last_ask: Optional[float] = None
+        self.last_price: Optional[float] = None
         self.price_sma: Optional[float] = None
         self.trading_range: Optional[float] = None
         self.is_trending_up: Optional[bool] = None
 
-        self.greeks: List[Greeks] = []
+        self.greeks: Deque[Greeks] = deque(maxlen=max_history)
+        self.last_delta: Optional[float] = None
         self.volatility_sma: Optional[float] = None
         self.delta_sma: Optional[float] = None
 
+        # Running totals and monotonic (tick, value) windows so statistics update in O(1) per tick
+        self._price_sum = 0.0
+        self._price_ticks = 0
+        self._ask_max_window: Deque[Tuple[int, float]] = deque()
+        self._bid_min_window: Deque[Tuple[int, float]] = deque()
+        self._volatility_sum = 0.0
+        self._delta_sum = 0.0
+
     def update_prices(self, quote_data: Dict[str, Any]) -> None:
         """
         Update price history with new quote data.
         
-        Adds new price data to history, trims excess history,
-        and recalculates price statistics.
+        Adds new price data to history (the oldest entry is evicted once
+        max_history is reached) and recalculates price statistics.
         
         Args:
             quote_data: Dictionary with bid_price, ask_price, bid_size, ask_size, and last_price.
         """
-        self.prices.append(Price(
+        price = Price(
             quote_data['bid_price'], 
             quote_data['ask_price'], 
             quote_data['bid_size'],
             quote_data['ask_size'], 
             quote_data['last_price']
-        ))
-        
-        if len(self.prices) > self.max_history:
-            self.prices.pop(0)
-            
-        self.price_sma = sum(p.midpoint_price for p in self.prices) / len(self.prices)
+        )
+        if len(self.prices) == self.max_history:
+            self._price_sum -= self.prices[0].midpoint_price
+        self.prices.append(price)
+        self._price_sum += price.midpoint_price
+        self.last_bid = price.bid_price
+        self.last_ask = price.ask_price
+        self.last_price = price.last_price
+
+        self.price_sma = self._price_sum / len(self.prices)
         
         # Calculate trading range (highest ask - lowest bid)
-        self.trading_range = max(p.ask_price for p in self.prices) - min(p.bid_price for p in self.prices)
+        self._price_ticks += 1
+        oldest_tick = self._price_ticks - len(self.prices)  # Ticks at or before this have been evicted
+        ask_window, bid_window = self._ask_max_window, self._bid_min_window
+        while ask_window and ask_window[-1][1] <= price.ask_price:
+            ask_window.pop()
+        ask_window.append((self._price_ticks, price.ask_price))
+        while ask_window[0][0] <= oldest_tick:
+            ask_window.popleft()
+        while bid_window and bid_window[-1][1] >= price.bid_price:
+            bid_window.pop()
+        bid_window.append((self._price_ticks, price.bid_price))
+        while bid_window[0][0] <= oldest_tick:
+            bid_window.popleft()
+        self.trading_range = ask_window[0][1] - bid_window[0][1]
         
         # Determine trend (at least 3 prices needed for meaningful trend)
         if len(self.prices) >= 3:
             # Simple trend detection based on recent price movement
-            recent_prices = [p.midpoint_price for p in self.prices[-3:]]
-            self.is_trending_up = recent_prices[-1] > recent_prices[0]
+            self.is_trending_up = self.prices[-1].midpoint_price > self.prices[-3].midpoint_price
         else:
             self.is_trending_up = None
 
@@ -87,23 +143,39 @@ class Symbol:
         """
         Update Greeks history with new data.
         
-        Adds new Greeks data to history, trims excess history,
-        and recalculates Greek statistics.
+        Adds new Greeks data to history (the oldest entry is evicted once
+        max_history is reached) and recalculates Greek statistics.
         
         Args:
             greek_data: Dictionary with volatility, delta, gamma, theta, rho, and vega.
         """
-        self.greeks.append(Greeks(
+        greeks = Greeks(
             greek_data['volatility'], 
             greek_data['delta'],  
             greek_data['gamma'],
             greek_data['theta'], 
             greek_data['rho'], 
             greek_data['vega']
-        ))
-        
-        if len(self.greeks) > self.max_history:
-            self.greeks.pop(0)
-            
-        self.volatility_sma = sum(g.volatility for g in self.greeks) / len(self.greeks)
-        self.delta_sma = sum(g.delta for g in self.greeks) / len(self.greeks)
+        )
+        if len(self.greeks) == self.max_history:
+            self._volatility_sum -= self.greeks[0].volatility
+            self._delta_sum -= self.greeks[0].delta
+        self.greeks.append(greeks)
+        self.last_delta = greeks.delta
+        self._volatility_sum += greeks.volatility
+        self._delta_sum += greeks.delta
+
+        self.volatility_sma = self._volatility_sum / len(self.greeks)
+        self.delta_sma = self._delta_sum / len(self.greeks)
+
+    def current_limit_price(self, limit_distance: float) -> float:
+        """
+        Calculate a limit price between the latest bid and ask.
+
+        Args:
+            limit_distance: Relative distance from bid to ask (0.0 = bid, 1.0 = ask).
+
+        Returns:
+            float: The limit price.
+        """
+        return self.last_bid + (self.last_ask - self.last_bid) * limit_distance
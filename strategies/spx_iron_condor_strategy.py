@@ -1,12 +1,165 @@
 import os
+import atexit
 import datetime
+import inspect
+import json
+import tempfile
+import threading
 import time
-import pytz
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Dict, List, Tuple, Optional, Any, Set
 from decimal import Decimal
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
+# Log through a queue; a listener thread does the file and console writes off the trading path
+_log_handler: Optional[QueueHandler] = None
+_log_setup_lock = threading.Lock()
+
+
+def _attach_log_handler(logger: logging.Logger) -> None:
+    """
+    Attach the queue log handler to a logger, creating it on first use.
+    
+    The file and console handlers and their listener thread are created
+    once per process and stay running for its lifetime; the listener is
+    stopped at exit, which flushes any queued records.
+    
+    Args:
+        logger: The logger to attach the handler to
+    """
+    global _log_handler
+    with _log_setup_lock:
+        if _log_handler is None:
+            log_queue = queue.Queue(-1)
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler("spx_iron_condor_strategy.log")
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+            listener = QueueListener(log_queue, file_handler, stream_handler)
+            listener.start()
+            atexit.register(listener.stop)
+            _log_handler = QueueHandler(log_queue)
+        if _log_handler not in logger.handlers:
+            logger.addHandler(_log_handler)
+        # The queue handler already writes to file and console; don't also emit through root's handlers
+        logger.propagate = False
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize trade values that json does not handle natively."""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    """
+    Write data as JSON to a temporary file and move it into place.
+    
+    A crash mid-write never leaves a truncated file behind, and a failed
+    write removes its temporary file.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable data (datetimes and Decimals are converted)
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, default=_json_default)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _accepts_keyword(func: Any, name: str) -> bool:
+    """
+    Check whether a callable accepts a keyword argument.
+    
+    Args:
+        func: The callable to inspect
+        name: Keyword argument name
+        
+    Returns:
+        True if func takes name as a keyword or accepts **kwargs
+    """
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in params or any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())
+
+
+class TradeSide:
+    """
+    Exit-tracking state for the short put or short call side of a trade.
+    
+    The trade itself stays a plain dict so it can be returned, logged, and
+    persisted as-is; the fields read on every exit check live here as slots.
+    
+    Attributes:
+        trade (Dict[str, Any]): The trade this side belongs to.
+        side (str): Either "put" or "call".
+        symbol (str): Symbol of the short option.
+        streamer_symbol (Optional[str]): Streamer symbol of the short option, if known.
+        num_contracts (int): Number of contracts in the trade.
+        credit (float): Total credit received for this side.
+        credit_per_contract (float): Credit received per contract.
+        exit_threshold_total (float): Cost to close at which the side should exit.
+        exit_mark (float): Short option price at which the side should exit.
+        closed (bool): Whether this side has been closed.
+        exit_detected_ts (Optional[float]): time.monotonic() when the exit condition was first seen.
+        next_check_ts (float): time.monotonic() before which the side is not checked.
+        close_retry_ts (float): time.monotonic() before which a failed close is not retried.
+    """
+
+    __slots__ = (
+        'trade',
+        'side',
+        'symbol',
+        'streamer_symbol',
+        'num_contracts',
+        'credit',
+        'credit_per_contract',
+        'exit_threshold_total',
+        'exit_mark',
+        'closed',
+        'exit_detected_ts',
+        'next_check_ts',
+        'close_retry_ts',
+    )
+
+    def __init__(self, trade: Dict[str, Any], side: str, exit_threshold: float) -> None:
+        """
+        Initialize exit tracking for one side of a trade.
+        
+        Args:
+            trade: The trade, with its "{side}_credit" and "{side}_closed" fields set
+            side: Either "put" or "call"
+            exit_threshold: Fraction of the credit at which the side should exit
+        """
+        self.trade = trade
+        self.side = side
+        self.symbol = trade["symbols"][f"short_{side}"]
+        self.streamer_symbol = trade.get("streamer_symbols", {}).get(f"short_{side}")
+        self.num_contracts = trade["num_contracts"]
+        self.credit = trade[f"{side}_credit"]
+        self.credit_per_contract = self.credit / self.num_contracts
+        self.exit_threshold_total = self.credit * exit_threshold
+        self.exit_mark = self.credit_per_contract * exit_threshold
+        self.closed = trade[f"{side}_closed"]
+        self.exit_detected_ts: Optional[float] = None
+        self.next_check_ts = 0.0
+        self.close_retry_ts = 0.0
+
 
 class SPXIronCondorStrategy:
     """
@@ -48,6 +201,8 @@ class SPXIronCondorStrategy:
         
         # Strategy configuration
         self.entry_time_eastern = "10:10"
+        self.market_open_eastern = datetime.time(9, 30)
+        self.market_close_eastern = datetime.time(16, 0)
         self.target_delta_min = 0.16
         self.target_delta_max = 0.25
         self.target_put_credit = 5.0
@@ -57,21 +212,49 @@ class SPXIronCondorStrategy:
         self.max_iron_condors = 6
         self.exit_threshold = 0.90  # Exit when cost to close exceeds 90% of credit
         self.exit_confirmation_time = 120  # 2 minutes in seconds
+        self.cheap_leg_ratio = 0.2  # Back off checking a side whose cost to close is below 20% of its threshold
+        self.cheap_leg_backoff = 60  # Seconds to skip a cheap side before checking it again
+        self.close_retry_delay = 30  # Seconds to wait before resending a close order that failed
+        self.state_path = "spx_iron_condor_state.json"  # Write-through copy of active trades; account is added to the name
+        self.subscribe_band_pct = 0.10  # Stream strikes within 10% of spot while selecting strikes
+        self.scan_cache_dir = ".cache"  # Where the existing-positions scan is cached when STRATEGY_CACHE=1
+        self.scan_cache_ttl = 60  # Seconds a cached scan stays valid
+        self.poll_interval = 10  # Seconds between polls near entry time or while trades are open
+        self.confirm_poll_interval = 2  # Seconds between polls while an exit is being confirmed
+        self.idle_poll_interval = 60  # Seconds between polls with nothing to enter or monitor
+        self.strike_cache_ttl = 90  # Seconds an entry retry (60s apart) may reuse the last strike selection
         
         # Strategy state
         self.active_trades = []
-        self.monitoring = False
-        
-        # Set up logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler("spx_iron_condor_strategy.log"),
-                logging.StreamHandler()
-            ]
-        )
+        self._trade_dates: Set[str] = set()  # Expiration dates of active trades
+        self._open_legs: Dict[str, TradeSide] = {}  # Short option symbol -> open trade side
+        self._trade_lock = threading.RLock()  # Serializes exit checks from the run loop, quote ticks, and close results
+        self._exit_pool = ThreadPoolExecutor(max_workers=8)  # Runs the broker calls for each side concurrently
+        self._close_pool = ThreadPoolExecutor(max_workers=4)  # Sends close orders; never waits on _trade_lock
+        self._trades_by_streamer: Dict[str, TradeSide] = {}  # Short-leg streamer symbol -> trade side
+        self._last_mark: Dict[str, float] = {}  # Short-leg streamer symbol -> latest ask (price to buy back)
+        self._state_lock = threading.Lock()  # Serializes writes of the state file
+        self._banded_streamer_symbols: List[str] = []  # Chain symbols streamed for strike selection
+        self._strike_cache: Optional[Tuple[str, Dict[str, Any], float]] = None  # (expiration, strikes, monotonic ts)
+        self._stop_event = threading.Event()  # Set by stop() to wake and end the run loop
+        # streamer_symbol is an optional keyword; brokers with the four-argument exit check don't take it
+        self._exit_check_takes_streamer = _accepts_keyword(
+            getattr(broker, 'check_option_exit_condition', None), 'streamer_symbol')
+        
+        # Entry time in Eastern, rebuilt only when the trading day rolls over
+        self._eastern = ZoneInfo("America/New_York")
+        self._cached_entry = (None, None)  # (date, target datetime)
+        self._today_date, self._today_str = None, ""  # Eastern date and its YYYY-MM-DD string
+        
+        # Attach the queue handler once; re-instantiating the strategy must not add more handlers
         self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.INFO)
+        _attach_log_handler(self.logger)
+    
+    @property
+    def monitoring(self) -> bool:
+        """Whether any trade side is still open and needs exit checks."""
+        return bool(self._open_legs)
     
     def select_account(self) -> bool:
         """
@@ -92,16 +275,16 @@ class SPXIronCondorStrategy:
         
         if preferred_account and preferred_account in self.broker.accounts:
             self.account_number = preferred_account
-            self.logger.info(f"Using account from TASTY_ACCOUNT: {self.account_number}")
+            self.logger.info("Using account from TASTY_ACCOUNT: %s", self.account_number)
             return True
             
         elif preferred_account:
-            self.logger.warning(f"Specified account {preferred_account} not found in available accounts.")
-            self.logger.warning(f"Available accounts: {list(self.broker.accounts.keys())}")
+            self.logger.warning("Specified account %s not found in available accounts.", preferred_account)
+            self.logger.warning("Available accounts: %s", list(self.broker.accounts.keys()))
             
         # Fall back to first account
-        self.account_number = list(self.broker.accounts.keys())[0]
-        self.logger.info(f"Using first available account: {self.account_number}")
+        self.account_number = next(iter(self.broker.accounts))
+        self.logger.info("Using first available account: %s", self.account_number)
         return True
     
     def set_account(self, account_number: str) -> None:
@@ -113,30 +296,69 @@ class SPXIronCondorStrategy:
         """
         if account_number in self.broker.accounts:
             self.account_number = account_number
-            self.logger.info(f"Using account: {account_number}")
+            self.logger.info("Using account: %s", account_number)
         else:
-            self.logger.error(f"Account {account_number} not found in available accounts.")
-            self.logger.error(f"Available accounts: {list(self.broker.accounts.keys())}")
+            self.logger.error("Account %s not found in available accounts.", account_number)
+            self.logger.error("Available accounts: %s", list(self.broker.accounts.keys()))
             raise ValueError(f"Account {account_number} not found in available accounts.")
     
-    def is_entry_time(self) -> bool:
+    def is_entry_time(self, now_eastern: Optional[datetime.datetime] = None) -> bool:
         """
         Check if it's time to enter trades based on the configured entry time.
         
+        Args:
+            now_eastern: Current Eastern time, if the caller already has it
+            
         Returns:
             True if current time is within entry window, False otherwise
         """
-        eastern = pytz.timezone('US/Eastern')
-        now = datetime.datetime.now(eastern)
-        target_time = datetime.datetime.strptime(
-            f"{now.strftime('%Y-%m-%d')} {self.entry_time_eastern}", 
-            "%Y-%m-%d %H:%M"
-        ).replace(tzinfo=eastern)
+        now = now_eastern or datetime.datetime.now(self._eastern)
         
         # Allow entry within a 5-minute window of the target time
-        time_diff = abs((now - target_time).total_seconds())
+        time_diff = abs((now - self._entry_target_time(now)).total_seconds())
         return time_diff <= 300  # 5 minutes
     
+    def _entry_target_time(self, now: datetime.datetime) -> datetime.datetime:
+        """
+        Get today's entry time in Eastern, rebuilding it only when the day rolls over.
+        
+        Args:
+            now: Current Eastern time
+            
+        Returns:
+            Today's target entry time
+        """
+        today = now.date()
+        if self._cached_entry[0] != today:
+            target_time = datetime.datetime.combine(
+                today, datetime.time.fromisoformat(self.entry_time_eastern), tzinfo=self._eastern)
+            self._cached_entry = (today, target_time)
+        return self._cached_entry[1]
+    
+    def _next_poll_interval(self, now_eastern: Optional[datetime.datetime] = None) -> float:
+        """
+        Choose how long the run loop waits before its next poll.
+        
+        Polls quickly while an exit is being confirmed, at the normal rate
+        near entry time or while trade sides are open, and slowly otherwise.
+        
+        Args:
+            now_eastern: Current Eastern time, if the caller already has it
+            
+        Returns:
+            Seconds to wait
+        """
+        # Quote ticks and close results change _open_legs from other threads
+        with self._trade_lock:
+            legs = list(self._open_legs.values())
+        if any(leg.exit_detected_ts is not None for leg in legs):
+            return self.confirm_poll_interval
+        
+        now = now_eastern or datetime.datetime.now(self._eastern)
+        if self.monitoring or abs((now - self._entry_target_time(now)).total_seconds()) <= 900:
+            return self.poll_interval
+        return self.idle_poll_interval
+    
     def get_current_expiration(self) -> str:
         """
         Get today's expiration date in YYYY-MM-DD format.
@@ -144,8 +366,21 @@ class SPXIronCondorStrategy:
         Returns:
             Today's date formatted as YYYY-MM-DD
         """
-        today = datetime.date.today()
-        return today.strftime("%Y-%m-%d")
+        return self._today_string(datetime.datetime.now(self._eastern).date())
+    
+    def _today_string(self, today: datetime.date) -> str:
+        """
+        Format today's date, reformatting only when the day rolls over.
+        
+        Args:
+            today: Today's Eastern date
+            
+        Returns:
+            Today's date formatted as YYYY-MM-DD
+        """
+        if today != self._today_date:
+            self._today_date, self._today_str = today, today.strftime("%Y-%m-%d")
+        return self._today_str
     
     def find_option_strikes(self) -> Dict[str, Any]:
         """
@@ -157,8 +392,21 @@ class SPXIronCondorStrategy:
         # Get today's expiration date
         expiration_date = self.get_current_expiration()
         
+        # Reuse a recent selection when retrying an entry
+        cached = self._strike_cache
+        if cached and cached[0] == expiration_date and time.monotonic() - cached[2] < self.strike_cache_ttl:
+            return cached[1]
+        
+        # Stream only strikes near the money; far out-of-the-money deltas are never in range
+        if hasattr(self.broker, 'subscribe_option_strikes'):
+            self._banded_streamer_symbols.extend(self.broker.subscribe_option_strikes(
+                underlying_symbol="SPX",
+                expiration_date=expiration_date,
+                band_pct=self.subscribe_band_pct
+            ))
+        
         # Use the broker to select strikes for an iron condor
-        return self.broker.select_iron_condor_strikes(
+        strikes = self.broker.select_iron_condor_strikes(
             underlying_symbol="SPX",
             expiration_date=expiration_date,
             delta_min=self.target_delta_min,
@@ -168,6 +416,9 @@ class SPXIronCondorStrategy:
             target_put_credit=self.target_put_credit,
             target_call_credit=self.target_call_credit
         )
+        if strikes:
+            self._strike_cache = (expiration_date, strikes, time.monotonic())
+        return strikes
     
     def calculate_max_contracts(self, strikes: Dict[str, Any]) -> int:
         """
@@ -182,8 +433,8 @@ class SPXIronCondorStrategy:
         if not self.account_number or not strikes:
             return 0
         
-        # Calculate the total credit per iron condor
-        total_credit = self.target_put_credit + self.target_call_credit
+        # Calculate the total credit per iron condor (Decimal so the price sent to the API is exact)
+        total_credit = Decimal(str(self.target_put_credit)) + Decimal(str(self.target_call_credit))
         
         # Use the broker to calculate max contracts
         return self.broker.calculate_max_iron_condor_contracts(
@@ -208,10 +459,10 @@ class SPXIronCondorStrategy:
         if not self.account_number or num_contracts <= 0:
             return {}
         
-        # Calculate total credit
-        total_credit = self.target_put_credit + self.target_call_credit
+        # Calculate total credit (Decimal so the order price is exact)
+        total_credit = Decimal(str(self.target_put_credit)) + Decimal(str(self.target_call_credit))
         
-        self.logger.info(f"Executing iron condor with {num_contracts} contracts at ${total_credit:.2f} credit")
+        self.logger.info("Executing iron condor with %d contracts at $%.2f credit", num_contracts, total_credit)
         
         # Use the broker to execute the iron condor
         trade_info = self.broker.execute_iron_condor(
@@ -227,37 +478,145 @@ class SPXIronCondorStrategy:
             self.logger.error("Failed to execute iron condor trade")
             return {}
         
-        self.logger.info(f"Order submitted successfully with ID: {trade_info['order_id']}")
+        self.logger.info("Order submitted successfully with ID: %s", trade_info['order_id'])
+        self._strike_cache = None
         
         # Add put/call specific credits and exit tracking to the trade info
-        trade_info["put_credit"] = self.target_put_credit * num_contracts
-        trade_info["call_credit"] = self.target_call_credit * num_contracts
-        trade_info["put_closed"] = False
-        trade_info["call_closed"] = False
-        trade_info["put_exit_detected_time"] = None
-        trade_info["call_exit_detected_time"] = None
-        
-        self.active_trades.append(trade_info)
+        self._track_trade(
+            trade_info,
+            put_credit=self.target_put_credit * num_contracts,
+            call_credit=self.target_call_credit * num_contracts
+        )
+        
+        self._persist_trades()
+        self._release_banded_symbols(trade_info)
+        self._subscribe_open_legs()
         return trade_info
     
+    def _track_trade(self, trade: Dict[str, Any], put_credit: float, call_credit: float) -> None:
+        """
+        Record per-side credits on a trade and start tracking it for exits.
+        
+        Args:
+            trade: The trade to track
+            put_credit: Total credit received for the put side
+            call_credit: Total credit received for the call side
+        """
+        trade["put_credit"] = put_credit
+        trade["call_credit"] = call_credit
+        trade["put_closed"] = False
+        trade["call_closed"] = False
+        self._add_trade(trade)
+    
+    def _add_trade(self, trade: Dict[str, Any]) -> None:
+        """
+        Add a trade with per-side credits to the active trades.
+        
+        Everything an exit check compares against is computed here once, in
+        each side's TradeSide, so the checks themselves do no credit or
+        threshold arithmetic and no dict lookups.
+        
+        Args:
+            trade: The trade to add
+        """
+        self.active_trades.append(trade)
+        self._trade_dates.add(trade["expiration_date"])
+        for side in ("put", "call"):
+            trade_side = TradeSide(trade, side, self.exit_threshold)
+            if not trade_side.closed:
+                self._open_legs[trade_side.symbol] = trade_side
+                self._watch_side(trade_side)
+    
+    def _release_banded_symbols(self, trade: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Stop streaming the strike-selection band, keeping the legs of a new trade.
+        
+        Called after an entry and whenever an entry attempt is skipped or
+        fails, so the band is never left subscribed between attempts.
+        
+        Args:
+            trade: The trade that was just entered, if any
+        """
+        if not self._banded_streamer_symbols or not hasattr(self.broker, 'unsubscribe_option_symbols'):
+            return
+        
+        trade_streamer_symbols = set(trade.get("streamer_symbols", {}).values()) if trade else set()
+        self.broker.unsubscribe_option_symbols(
+            [s for s in self._banded_streamer_symbols if s not in trade_streamer_symbols])
+        self._banded_streamer_symbols = []
+    
+    def _state_file(self) -> str:
+        """
+        Get the state file path for the selected account.
+        
+        Returns:
+            state_path with the account number added before the extension
+        """
+        base, ext = os.path.splitext(self.state_path)
+        return f"{base}_{self.account_number}{ext}"
+    
+    def _persist_trades(self) -> None:
+        """
+        Write today's active trades to the account's state file.
+        
+        Trades for earlier expirations are left out, so expired legs are
+        never restored.
+        """
+        today = self.get_current_expiration()
+        with self._state_lock:
+            try:
+                _write_json_atomic(self._state_file(),
+                                   [t for t in self.active_trades if t["expiration_date"] == today])
+            except (OSError, TypeError, ValueError) as e:
+                self.logger.error("Failed to persist active trades: %s", e)
+    
+    def _load_trades(self) -> bool:
+        """
+        Restore today's active trades from the account's state file.
+        
+        Exit confirmation timers are based on time.monotonic(), which does not
+        survive a restart, so they start over on load.
+        
+        Returns:
+            True if trades were restored, False otherwise
+        """
+        state_file = self._state_file()
+        try:
+            with open(state_file) as f:
+                trades = json.load(f)
+        except (OSError, ValueError) as e:
+            if os.path.exists(state_file):
+                self.logger.warning("Could not read state file %s: %s", state_file, e)
+            return False
+        
+        today = self.get_current_expiration()
+        trades = [t for t in trades if t.get("expiration_date") == today]
+        for trade in trades:
+            if isinstance(trade.get("entry_time"), str):
+                trade["entry_time"] = datetime.datetime.fromisoformat(trade["entry_time"])
+            self._add_trade(trade)
+        
+        self.logger.info("Restored %d trades from %s", len(trades), state_file)
+        return bool(trades)
+    
     def initialize_from_existing_positions(self) -> None:
         """
         Scan for and identify existing iron condor positions.
         
-        Uses the broker to find existing positions and adds them
+        Restores today's trades from the state file when one exists.
+        Otherwise uses the broker to find existing positions and adds them
         to the active_trades list for monitoring and management.
         """
         if not self.account_number:
             return
 
+        if self._load_trades():
+            self._subscribe_open_legs()
+            return
+
         self.logger.info("Scanning for existing iron condor positions...")
         
-        # Use the broker to scan for iron condor positions
-        iron_condors = self.broker.scan_for_iron_condor_positions(
-            account_number=self.account_number,
-            underlying_symbol="SPX",
-            expiration_date=self.get_current_expiration()
-        )
+        iron_condors = self._scan_iron_condor_positions(self.get_current_expiration())
         
         if not iron_condors:
             self.logger.info("No existing iron condor positions found")
@@ -270,148 +629,389 @@ class SPXIronCondorStrategy:
             put_credit = ic.get("put_credit", total_credit / 2)
             call_credit = ic.get("call_credit", total_credit / 2)
             
-            trade = {
-                **ic,  # Include all original fields
-                "put_credit": put_credit,
-                "call_credit": call_credit,
-                "put_closed": False,
-                "call_closed": False,
-                "put_exit_detected_time": None,
-                "call_exit_detected_time": None
-            }
+            # The scanned position becomes the trade; the scan result is not used elsewhere
+            self._track_trade(ic, put_credit=put_credit, call_credit=call_credit)
+            self.logger.info("Added existing iron condor to active trades with %s contracts", ic['num_contracts'])
+        
+        self._persist_trades()
+        self._subscribe_open_legs()
+    
+    def _subscribe_open_legs(self) -> None:
+        """Stream quotes for the short legs of every open trade side with one broker call."""
+        if hasattr(self.broker, 'subscribe_option_quotes'):
+            with self._trade_lock:
+                legs = list(self._open_legs.values())
+            self.broker.subscribe_option_quotes([leg.streamer_symbol for leg in legs if leg.streamer_symbol])
+    
+    def _scan_iron_condor_positions(self, expiration_date: str) -> List[Dict[str, Any]]:
+        """
+        Scan for existing iron condor positions, reusing a recent scan from disk.
+        
+        The disk cache is only used when the STRATEGY_CACHE environment
+        variable is set to 1. A cached scan is reused for scan_cache_ttl
+        seconds, so a quick restart skips the broker scan entirely.
+        
+        Args:
+            expiration_date: Expiration date to scan for (YYYY-MM-DD)
+            
+        Returns:
+            List of iron condor positions
+        """
+        use_cache = os.getenv("STRATEGY_CACHE") == "1"
+        cache_path = os.path.join(self.scan_cache_dir, f"ic_{self.account_number}_{expiration_date}.json")
+        
+        if use_cache:
+            try:
+                if time.time() - os.path.getmtime(cache_path) < self.scan_cache_ttl:
+                    with open(cache_path) as f:
+                        iron_condors = json.load(f)
+                    for ic in iron_condors:
+                        if isinstance(ic.get("entry_time"), str):
+                            ic["entry_time"] = datetime.datetime.fromisoformat(ic["entry_time"])
+                    self.logger.info("Using cached position scan from %s", cache_path)
+                    return iron_condors
+            except (OSError, ValueError):
+                pass
+        
+        # Use the broker to scan for iron condor positions
+        iron_condors = self.broker.scan_for_iron_condor_positions(
+            account_number=self.account_number,
+            underlying_symbol="SPX",
+            expiration_date=expiration_date
+        )
+        
+        if use_cache and iron_condors is not None:
+            try:
+                os.makedirs(self.scan_cache_dir, exist_ok=True)
+                _write_json_atomic(cache_path, iron_condors)
+            except (OSError, TypeError, ValueError) as e:
+                self.logger.warning("Failed to cache position scan: %s", e)
+        
+        return iron_condors
+    
+    def check_exit_conditions(self, now: Optional[float] = None) -> None:
+        """
+        Check if exit conditions are met for any active trades.
+        
+        Args:
+            now: time.monotonic() for this check, shared by every side; read here if not given
+        """
+        # Nothing to do once every side has closed; skip the lock and the leg scan
+        if not self._open_legs:
+            return
+        
+        if now is None:
+            now = time.monotonic()
+        
+        # Collect the sides under the lock, but never hold it across a broker call:
+        # quote ticks take the same lock and must not block the broker's reads
+        with self._trade_lock:
+            legs = self._collect_monitored_legs(now)
+            if not legs:
+                return
             
-            self.active_trades.append(trade)
-            self.logger.info(f"Added existing iron condor to active trades with {trade['num_contracts']} contracts")
-    
-    def check_exit_conditions(self) -> None:
-        """Check if exit conditions are met for any active trades."""
-        for trade in self.active_trades:
-            # Skip if both sides already closed
-            if trade["put_closed"] and trade["call_closed"]:
-                continue
+            # Sides with a streamed mark are evaluated locally; only the rest need the broker
+            last_mark = self._last_mark
+            to_close = [leg for leg in legs
+                        if leg.streamer_symbol in last_mark
+                        and self._apply_mark(leg, last_mark[leg.streamer_symbol], now)]
+            legs = [leg for leg in legs if leg.streamer_symbol not in last_mark]
+            self._close_sides(to_close)
+        
+        if not legs:
+            return
+        
+        # Evaluate the remaining sides with a single broker call when the broker supports it
+        bulk_check = getattr(self.broker, 'check_option_exit_conditions', None)
+        if bulk_check:
+            try:
+                results = bulk_check(
+                    [(leg.symbol, leg.credit_per_contract, leg.num_contracts, leg.streamer_symbol)
+                     for leg in legs],
+                    exit_threshold=self.exit_threshold
+                )
+            except Exception as e:
+                self.logger.error("Error checking exit conditions: %s", e)
+                return
             
-            # Check put and call exit conditions
-            if not trade["put_closed"]:
-                self._check_put_exit(trade)
+            with self._trade_lock:
+                self._close_sides([leg for leg, (should_exit, cost_to_close) in zip(legs, results)
+                                   if not leg.closed and self._apply_side_exit(leg, should_exit, cost_to_close, now)])
+            return
+        
+        # Otherwise check each side concurrently; each side applies its result under the lock
+        submit, check_side_exit = self._exit_pool.submit, self._check_side_exit
+        futures = [submit(check_side_exit, leg, now) for leg in legs]
+        
+        done, not_done = wait(futures, timeout=8)
+        for future in done:
+            if future.exception():
+                self.logger.error("Error checking exit conditions: %s", future.exception())
+        if not_done:
+            self.logger.warning("%d exit checks still running after 8 seconds", len(not_done))
+    
+    def _collect_monitored_legs(self, now: float) -> List[TradeSide]:
+        """
+        Collect the open trade sides that are due for an exit check.
+        
+        Args:
+            now: time.monotonic() for this check
             
-            if not trade["call_closed"]:
-                self._check_call_exit(trade)
+        Returns:
+            Every trade side that is neither closed nor backed off
+        """
+        return [leg for leg in self._open_legs.values() if now >= leg.next_check_ts]
     
-    def _check_put_exit(self, trade: Dict[str, Any]) -> None:
+    def _watch_side(self, leg: TradeSide) -> None:
         """
-        Check exit conditions for the put side of a trade.
+        Check a trade side's exit as soon as its short leg is quoted.
+        
+        Registers a quote listener for the short option's streamer symbol when
+        the broker supports it. Brokers without quote listeners rely on the
+        polling in run().
         
         Args:
-            trade: The trade to check exit conditions for
+            leg: The trade side to watch
         """
-        short_put_symbol = trade["symbols"]["short_put"]
+        if not leg.streamer_symbol or not hasattr(self.broker, 'add_quote_listener'):
+            return
         
-        # Use the broker to check exit condition for the short put
-        should_exit, cost_to_close = self.broker.check_option_exit_condition(
-            symbol=short_put_symbol,
-            original_credit=trade["put_credit"] / trade["num_contracts"],
-            num_contracts=trade["num_contracts"],
-            exit_threshold=self.exit_threshold
-        )
+        self._trades_by_streamer[leg.streamer_symbol] = leg
+        self.broker.add_quote_listener(leg.streamer_symbol, self._on_price_tick)
+    
+    def _unwatch_side(self, leg: TradeSide) -> None:
+        """
+        Stop tick-driven exit checks for one side of a trade.
         
-        if should_exit:
-            if trade["put_exit_detected_time"] is None:
-                # First time detecting exit condition
-                self.logger.info(f"Put exit condition detected. Cost to close: ${cost_to_close:.2f}, " +
-                               f"Original credit: ${trade['put_credit']:.2f}, " +
-                               f"Threshold: ${trade['put_credit'] * self.exit_threshold:.2f}")
-                trade["put_exit_detected_time"] = datetime.datetime.now()
-            else:
-                # Check if condition has persisted long enough
-                time_since_detection = (datetime.datetime.now() - trade["put_exit_detected_time"]).total_seconds()
-                if time_since_detection >= self.exit_confirmation_time:
-                    self._close_put_side(trade)
-        else:
-            # Reset detection time if price improves
-            trade["put_exit_detected_time"] = None
+        Args:
+            leg: The trade side being watched
+        """
+        if leg.streamer_symbol and self._trades_by_streamer.pop(leg.streamer_symbol, None):
+            if hasattr(self.broker, 'remove_quote_listener'):
+                self.broker.remove_quote_listener(leg.streamer_symbol, self._on_price_tick)
+            self._last_mark.pop(leg.streamer_symbol, None)
     
-    def _check_call_exit(self, trade: Dict[str, Any]) -> None:
+    def _on_price_tick(self, streamer_symbol: str, quote_data: Dict[str, Any]) -> None:
         """
-        Check exit conditions for the call side of a trade.
+        Record the latest ask for a short leg and check its exit without a broker call.
         
         Args:
-            trade: The trade to check exit conditions for
+            streamer_symbol: The streamer symbol that received a quote
+            quote_data: The quote, with at least ask_price
         """
-        short_call_symbol = trade["symbols"]["short_call"]
+        leg = self._trades_by_streamer.get(streamer_symbol)
+        ask_price = quote_data.get("ask_price")
+        if not leg or ask_price is None:
+            return
         
-        # Use the broker to check exit condition for the short call
+        self._last_mark[streamer_symbol] = ask_price
+        
+        # A side that was recently far below its exit threshold is backed off for ticks as well as polls
+        now = time.monotonic()
+        if now < leg.next_check_ts:
+            return
+        with self._trade_lock:
+            if not leg.closed and self._apply_mark(leg, ask_price, now):
+                self._close_side(leg)
+    
+    def _apply_mark(self, leg: TradeSide, mark: float, now: Optional[float] = None) -> bool:
+        """
+        Update one side of a trade from the latest streamed price of its short leg.
+        
+        Args:
+            leg: The trade side to update
+            mark: Latest price to buy back one contract of the short option
+            now: time.monotonic() for this check; read here if not given
+            
+        Returns:
+            True if the exit condition has persisted long enough to close the side
+        """
+        return self._apply_side_exit(leg, mark >= leg.exit_mark, mark * leg.num_contracts, now)
+    
+    def _check_side_exit(self, leg: TradeSide, now: Optional[float] = None) -> None:
+        """
+        Check exit conditions for one side of a trade.
+        
+        Args:
+            leg: The trade side to check exit conditions for
+            now: time.monotonic() for this check; read here if not given
+        """
+        # Skip a side that was recently far below its exit threshold
+        if now is None:
+            now = time.monotonic()
+        if now < leg.next_check_ts:
+            return
+        
+        # Use the broker to check exit condition for the short option
+        kwargs = {'streamer_symbol': leg.streamer_symbol} if self._exit_check_takes_streamer else {}
         should_exit, cost_to_close = self.broker.check_option_exit_condition(
-            symbol=short_call_symbol,
-            original_credit=trade["call_credit"] / trade["num_contracts"],
-            num_contracts=trade["num_contracts"],
-            exit_threshold=self.exit_threshold
+            symbol=leg.symbol,
+            original_credit=leg.credit_per_contract,
+            num_contracts=leg.num_contracts,
+            exit_threshold=self.exit_threshold,
+            **kwargs
         )
+        with self._trade_lock:
+            if not leg.closed and self._apply_side_exit(leg, should_exit, cost_to_close, now):
+                self._close_side(leg)
+    
+    def _apply_side_exit(
+            self,
+            leg: TradeSide,
+            should_exit: bool,
+            cost_to_close: Optional[float],
+            now: Optional[float] = None
+    ) -> bool:
+        """
+        Update one side of a trade with the result of an exit check.
+        
+        Starts, confirms, or resets the exit confirmation window.
+        
+        Args:
+            leg: The trade side that was checked
+            should_exit: Whether the cost to close exceeded the exit threshold
+            cost_to_close: Current cost to close the side, or None if the broker had no price
+            now: time.monotonic() for this check; read here if not given
+            
+        Returns:
+            True if the exit condition has persisted long enough to close the side
+        """
+        if now is None:
+            now = time.monotonic()
+        
+        # Back off while the side is cheap, resume full-rate checks once it reaches half the threshold
+        # A side with no price yet is retried on the next pass, not backed off
+        threshold_total = leg.exit_threshold_total
+        if cost_to_close is not None and threshold_total > 0:
+            ratio = cost_to_close / threshold_total
+            if ratio < self.cheap_leg_ratio:
+                leg.next_check_ts = now + self.cheap_leg_backoff
+            elif ratio >= 0.5:
+                leg.next_check_ts = 0.0
         
         if should_exit:
-            if trade["call_exit_detected_time"] is None:
+            if leg.exit_detected_ts is None:
                 # First time detecting exit condition
-                self.logger.info(f"Call exit condition detected. Cost to close: ${cost_to_close:.2f}, " +
-                               f"Original credit: ${trade['call_credit']:.2f}, " +
-                               f"Threshold: ${trade['call_credit'] * self.exit_threshold:.2f}")
-                trade["call_exit_detected_time"] = datetime.datetime.now()
+                self.logger.info("%s exit condition detected. Cost to close: $%.2f, "
+                                 "Original credit: $%.2f, Threshold: $%.2f",
+                                 leg.side.capitalize(), cost_to_close, leg.credit, threshold_total)
+                leg.exit_detected_ts = now
             else:
-                # Check if condition has persisted long enough
-                time_since_detection = (datetime.datetime.now() - trade["call_exit_detected_time"]).total_seconds()
-                if time_since_detection >= self.exit_confirmation_time:
-                    self._close_call_side(trade)
+                # Check if condition has persisted long enough and no failed close is cooling down
+                return now - leg.exit_detected_ts >= self.exit_confirmation_time and now >= leg.close_retry_ts
         else:
             # Reset detection time if price improves
-            trade["call_exit_detected_time"] = None
+            leg.exit_detected_ts = None
+        return False
     
-    def _close_put_side(self, trade: Dict[str, Any]) -> None:
+    def _close_sides(self, legs: List[TradeSide]) -> None:
         """
-        Close the put side of a trade (buy back short put).
+        Close several trade sides, sending the close orders concurrently.
+        
+        When both sides of a condor trigger together, neither close order
+        waits for the other's round trip.
         
         Args:
-            trade: The trade to close the put side for
+            legs: The trade sides to close
+        """
+        if len(legs) == 1 or hasattr(self.broker, 'submit_close_option_position'):
+            for leg in legs:
+                self._close_side(leg)  # Returns once the order is submitted when the broker supports it
+        elif legs:
+            list(self._close_pool.map(self._close_side, legs))
+    
+    def _close_side(self, leg: TradeSide) -> None:
         """
-        self.logger.info(f"Closing put side of trade {trade['order_id']}")
+        Close one side of a trade (buy back the short option).
         
-        # Use the broker to close the short put position
-        short_put_symbol = trade["symbols"]["short_put"]
+        When the broker can submit orders without blocking, exit checks stop
+        as soon as the order is sent and resume if the order fails. The state
+        file only records the side as closed once the broker acknowledges it.
         
+        Args:
+            leg: The trade side to close
+        """
+        self.logger.info("Closing %s side of trade %s", leg.side, leg.trade["order_id"])
+        
+        submit_close = getattr(self.broker, 'submit_close_option_position', None)
+        if submit_close:
+            self._stop_tracking_side(leg)
+            future = submit_close(
+                account_number=self.account_number,
+                symbol=leg.symbol,
+                quantity=leg.num_contracts,
+                action="Buy to Close"
+            )
+            # Handle the result on our own pool so a broker worker never waits on _trade_lock
+            future.add_done_callback(lambda f: self._close_pool.submit(self._on_close_result, leg, f))
+            return
+        
+        # Use the broker to close the short position
         order_id = self.broker.close_option_position(
             account_number=self.account_number,
-            symbol=short_put_symbol,
-            quantity=trade["num_contracts"],
+            symbol=leg.symbol,
+            quantity=leg.num_contracts,
             action="Buy to Close"
         )
         
         if order_id:
-            self.logger.info(f"Successfully closed put side with order ID: {order_id}")
-            trade["put_closed"] = True
+            self.logger.info("Successfully closed %s side with order ID: %s", leg.side, order_id)
+            self._stop_tracking_side(leg)
+            self._record_side_closed(leg)
         else:
-            self.logger.error("Failed to close put side")
+            self.logger.error("Failed to close %s side; retrying in %d seconds", leg.side, self.close_retry_delay)
+            leg.close_retry_ts = time.monotonic() + self.close_retry_delay
     
-    def _close_call_side(self, trade: Dict[str, Any]) -> None:
+    def _on_close_result(self, leg: TradeSide, future: "Future[Optional[str]]") -> None:
         """
-        Close the call side of a trade (buy back short call).
+        Confirm or roll back a side whose exit checks stopped when its close order was submitted.
         
         Args:
-            trade: The trade to close the call side for
+            leg: The trade side being closed
+            future: The submitted close order, resolving to the order ID or None
         """
-        self.logger.info(f"Closing call side of trade {trade['order_id']}")
+        try:
+            order_id = future.result()
+        except Exception as e:
+            self.logger.error("Error closing %s side: %s", leg.side, e)
+            order_id = None
         
-        # Use the broker to close the short call position
-        short_call_symbol = trade["symbols"]["short_call"]
+        if order_id:
+            self.logger.info("Successfully closed %s side with order ID: %s", leg.side, order_id)
+            self._record_side_closed(leg)
+            return
         
-        order_id = self.broker.close_option_position(
-            account_number=self.account_number,
-            symbol=short_call_symbol,
-            quantity=trade["num_contracts"],
-            action="Buy to Close"
-        )
+        self.logger.error("Failed to close %s side; retrying in %d seconds", leg.side, self.close_retry_delay)
+        with self._trade_lock:
+            leg.close_retry_ts = time.monotonic() + self.close_retry_delay
+            leg.closed = False
+            self._open_legs[leg.symbol] = leg
+            self._watch_side(leg)
+    
+    def _stop_tracking_side(self, leg: TradeSide) -> None:
+        """
+        Stop exit checks for one side of a trade.
         
-        if order_id:
-            self.logger.info(f"Successfully closed call side with order ID: {order_id}")
-            trade["call_closed"] = True
-        else:
-            self.logger.error("Failed to close call side")
+        Args:
+            leg: The trade side being closed
+        """
+        leg.closed = True
+        self._open_legs.pop(leg.symbol, None)
+        self._unwatch_side(leg)
+    
+    def _record_side_closed(self, leg: TradeSide) -> None:
+        """
+        Record an acknowledged close on the trade and in the state file.
+        
+        Args:
+            leg: The trade side that was closed
+        """
+        leg.trade[f"{leg.side}_closed"] = True
+        self._persist_trades()
+    
+    def stop(self) -> None:
+        """Stop the run loop, waking it immediately if it is waiting."""
+        self._stop_event.set()
     
     def run(self) -> None:
         """Main method to run the trading strategy."""
@@ -429,78 +1029,69 @@ class SPXIronCondorStrategy:
         # Scan for existing positions
         self.initialize_from_existing_positions()
         
-        # If existing trades found, enable monitoring
+        # Existing trades with open sides are monitored from the start
         if self.active_trades:
-            self.logger.info(f"Found {len(self.active_trades)} existing trades, enabling monitoring")
-            self.monitoring = True
+            self.logger.info("Found %d existing trades, enabling monitoring", len(self.active_trades))
         
         try:
-            while True:
-                current_time = datetime.datetime.now(pytz.timezone('US/Eastern'))
+            while not self._stop_event.is_set():
+                current_time = datetime.datetime.now(self._eastern)
                 
                 # Check if it's a trading day
                 if current_time.weekday() >= 5:  # Saturday or Sunday
                     self.logger.info("Weekend - market closed. Sleeping for 1 hour.")
-                    time.sleep(3600)
+                    self._stop_event.wait(3600)
                     continue
                 
                 # Check if market is open
-                market_open = datetime.time(9, 30)
-                market_close = datetime.time(16, 0)
-                current_time_only = current_time.time()
-                
-                if not (market_open <= current_time_only <= market_close):
+                if not (self.market_open_eastern <= current_time.time() <= self.market_close_eastern):
                     self.logger.info("Market closed. Sleeping for 15 minutes.")
-                    time.sleep(900)
+                    self._stop_event.wait(900)
                     continue
                 
                 # Entry logic - only run if no active trades with today's expiration
-                today = datetime.date.today().strftime("%Y-%m-%d")
-                todays_trades = [t for t in self.active_trades if t["expiration_date"] == today]
+                today = self._today_string(current_time.date())
                 
-                if not todays_trades and self.is_entry_time():
+                if today not in self._trade_dates and self.is_entry_time(current_time):
                     self.logger.info("Entry time detected. Looking for trades...")
                     
                     # Find appropriate strikes
                     strikes = self.find_option_strikes()
                     if not strikes:
+                        self._release_banded_symbols()
                         self.logger.error("Failed to find appropriate strikes. Trying again in 1 minute.")
-                        time.sleep(60)
+                        self._stop_event.wait(60)
                         continue
                     
                     # Calculate max contracts
                     num_contracts = self.calculate_max_contracts(strikes)
                     if num_contracts <= 0:
+                        self._release_banded_symbols()
                         self.logger.error("Cannot trade any contracts. Trying again in 1 minute.")
-                        time.sleep(60)
+                        self._stop_event.wait(60)
                         continue
                     
                     # Execute the trade
                     trade = self.execute_entry(strikes, num_contracts)
                     if not trade:
+                        self._release_banded_symbols()
                         self.logger.error("Failed to execute trade. Trying again in 1 minute.")
-                        time.sleep(60)
+                        self._stop_event.wait(60)
                         continue
                     
-                    self.logger.info(f"Successfully entered iron condor trade with {num_contracts} contracts")
-                    self.monitoring = True
-                
-                # Exit logic - check for conditions to close positions
-                if self.monitoring and self.active_trades:
-                    self.check_exit_conditions()
+                    self.logger.info("Successfully entered iron condor trade with %d contracts", num_contracts)
                 
-                # Check if we need to keep monitoring
-                active_orders = [t for t in self.active_trades if not (t["put_closed"] and t["call_closed"])]
-                if not active_orders:
-                    self.monitoring = False
+                # Exit logic - quote ticks trigger checks as they arrive; this poll is the fallback
+                if self.monitoring:
+                    self.check_exit_conditions(time.monotonic())
                 
-                # Sleep between checks
-                time.sleep(10)
+                # Wait between checks; quote ticks drive exit checks in the meantime
+                self._stop_event.wait(self._next_poll_interval(current_time))
         
         except KeyboardInterrupt:
             self.logger.info("Strategy stopped by user")
         except Exception as e:
-            self.logger.exception(f"Error in strategy: {e}")
+            self.logger.exception("Error in strategy: %s", e)
         finally:
             self.logger.info("Strategy stopped")
 